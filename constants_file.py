@@ -4,27 +4,27 @@ All constants must include:
 1. Value with appropriate precision
 2. Units in square brackets
 3. Source citation
-"""
-
-import math
-
-# Mathematical constants
-PI: float = math.pi  # Ratio of circumference to diameter
-E: float = math.e  # Euler's number
 
-# Physical constants - SI units
-GRAVITY_M_S2: float = 9.80665  # [m/s²] Standard gravity, ISO 80000-3:2006
-SPEED_OF_LIGHT_M_S: float = 299792458  # [m/s] Exact by definition, SI
-AIR_DENSITY_SEA_LEVEL_KG_M3: float = 1.225  # [kg/m³] ISA at sea level, 15°C
+Constants shared with python/src/constants.py are re-exported from there so
+the two files cannot drift apart; only the course, club and atmospheric values
+that have no counterpart in that module are defined here.
+"""
 
-# Golf-specific constants
-GOLF_BALL_MASS_KG: float = 0.04593  # [kg] USGA Rule 5-1 (1.620 oz max)
-GOLF_BALL_DIAMETER_M: float = 0.04267  # [m] USGA Rule 5-2 (1.680 in min)
-# Smooth ball at Re~150,000 per Bearman & Harvey 1976
-GOLF_BALL_DRAG_COEFFICIENT: float = 0.25
+from python.src.constants import (
+    AIR_DENSITY_SEA_LEVEL_KG_M3,
+    GOLF_BALL_DIAMETER_M,
+    GOLF_BALL_DRAG_COEFFICIENT,
+    GOLF_BALL_MASS_KG,
+    GRAVITY_M_S2,
+    PI,
+    SPEED_OF_LIGHT_M_S,
+    E,
+)
+from python.src.constants import (
+    DRIVER_LOFT_TYPICAL_DEG as DRIVER_LOFT_DEG,  # [deg] Typical driver loft angle
+)
 
 # Club specifications
-DRIVER_LOFT_DEG: float = 10.5  # [deg] Typical driver loft angle
 IRON_7_LOFT_DEG: float = 34.0  # [deg] Standard 7-iron loft
 PUTTER_LOFT_DEG: float = 3.0  # [deg] Standard putter loft
 
@@ -37,3 +37,23 @@ BUNKER_DEPTH_MM: float = 100.0  # [mm] Standard bunker depth
 TEMPERATURE_C: float = 20.0  # [°C] Standard temperature
 PRESSURE_HPA: float = 1013.25  # [hPa] Standard atmospheric pressure
 HUMIDITY_PERCENT: float = 50.0  # [%] Standard relative humidity
+
+__all__ = [
+    "AIR_DENSITY_SEA_LEVEL_KG_M3",
+    "BUNKER_DEPTH_MM",
+    "DRIVER_LOFT_DEG",
+    "GOLF_BALL_DIAMETER_M",
+    "GOLF_BALL_DRAG_COEFFICIENT",
+    "GOLF_BALL_MASS_KG",
+    "GRAVITY_M_S2",
+    "GREEN_SPEED_STIMP",
+    "HUMIDITY_PERCENT",
+    "IRON_7_LOFT_DEG",
+    "PI",
+    "PRESSURE_HPA",
+    "PUTTER_LOFT_DEG",
+    "ROUGH_HEIGHT_MM",
+    "SPEED_OF_LIGHT_M_S",
+    "TEMPERATURE_C",
+    "E",
+]
@@ -8,7 +8,6 @@ __version__ = "1.0.0"
 __author__ = "Scientific Computing Team"
 __email__ = "team@example.com"
 
-
 # Export commonly used functions and constants
 from .constants import (
     DEFAULT_RANDOM_SEED,
@@ -18,7 +17,45 @@ from .constants import (
     PI,
     E,
 )
-from .logger_utils import get_logger, set_seeds, setup_logging
+
+# Stands in for typing.TYPE_CHECKING, which type checkers treat the same way,
+# since importing typing would cost more than everything else here
+TYPE_CHECKING = False
+
+# The logging helpers are imported on first use, so code that only needs the
+# constants does not pay for importing logger_utils
+_LOGGER_UTILS_EXPORTS = frozenset({"get_logger", "set_seeds", "setup_logging"})
+
+if TYPE_CHECKING:
+    from .logger_utils import get_logger, set_seeds, setup_logging
+else:
+
+    def __getattr__(name: str) -> object:
+        """Import the logging helpers on first access (PEP 562).
+
+        Args:
+            name: Attribute being looked up on the package
+
+        Returns:
+            The helper, which is cached as a package global
+
+        Raises:
+            AttributeError: If name is not a logging helper
+
+        """
+        if name in _LOGGER_UTILS_EXPORTS:
+            from . import logger_utils
+
+            value = getattr(logger_utils, name)
+            globals()[name] = value
+            return value
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    def __dir__() -> list[str]:
+        """List package attributes, including the logging helpers."""
+        return sorted({*globals(), *_LOGGER_UTILS_EXPORTS})
+
 
 __all__ = [
     "DEFAULT_RANDOM_SEED",
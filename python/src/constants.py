@@ -10,6 +10,7 @@ properties used in scientific computing applications.
 """
 
 import math
+from types import MappingProxyType
 
 # Mathematical constants
 PI: float = math.pi  # [dimensionless] Ratio of circumference to diameter
@@ -61,9 +62,22 @@ SPIN_DECAY_RATE_S: float = 0.05  # [1/s] Typical spin decay, per Trackman data
 AIR_VISCOSITY_KG_M_S: float = 1.789e-5  # [kg/(m·s)] Dynamic viscosity at 15°C
 
 # Numerical constants
-EPSILON: float = 1e-15  # [dimensionless] Machine epsilon for double precision
+# Pick the tolerance named for the job: a single tiny EPSILON is lost to
+# rounding when added to values near 1 and far too tight as a stopping criterion
+EPSILON: float = 1e-15  # [dimensionless] Legacy near-zero guard, kept for callers
+EPSILON_DENOMINATOR: float = 1e-8  # [dimensionless] Added to denominators, x/(y+ε)
+EPSILON_SQUARED: float = EPSILON_DENOMINATOR**2  # [dimensionless] For √(v+ε²)
+EPSILON_CONVERGENCE: float = 1e-6  # [dimensionless] Iterative solver stopping tolerance
+EPSILON_ROOTFIND: float = 1.49e-8  # [dimensionless] √(float64 eps), scipy fsolve xtol
 MAX_ITERATIONS: int = 10000  # [dimensionless] Maximum iterations for numerical methods
-CONVERGENCE_TOLERANCE: float = 1e-6  # [dimensionless] Default convergence tolerance
+CONVERGENCE_TOLERANCE: float = EPSILON_CONVERGENCE  # [dimensionless] Default tolerance
 
 # Reproducibility
 DEFAULT_RANDOM_SEED: int = 42  # [dimensionless] Answer to everything
+
+# Read-only view of every constant above, built once at import. Bulk and
+# by-name lookups go through this frozen table instead of getattr() on the
+# module, and callers cannot rebind a constant through it.
+CONSTANTS: MappingProxyType[str, object] = MappingProxyType(
+    {name: value for name, value in globals().items() if name.isupper()},
+)
@@ -0,0 +1,79 @@
+"""Vectorized unit conversions built on the factors in the constants module.
+
+Each helper scales a whole array by one conversion factor in a single NumPy
+ufunc call, so batched callers avoid a Python-level loop per element. Pass
+``out`` to write into a preallocated buffer when converting repeatedly.
+"""
+
+import numpy as np
+import numpy.typing as npt
+
+from .constants import (
+    DEG_TO_RAD,
+    KG_TO_LB,
+    M_TO_FT,
+    M_TO_YARD,
+    MPS_TO_KPH,
+    MPS_TO_MPH,
+    RAD_TO_DEG,
+)
+
+FloatArray = npt.NDArray[np.float64]
+
+
+def convert(
+    values: npt.ArrayLike,
+    factor: float,
+    out: FloatArray | None = None,
+) -> FloatArray:
+    """Multiply values by a conversion factor element-wise.
+
+    Args:
+        values: Scalar or array of values in the source unit
+        factor: Factor converting the source unit to the target unit
+        out: Optional preallocated array to write the result into
+
+    Returns:
+        Array of converted values, 0-d for scalar input (``out`` itself when
+        given)
+
+    """
+    # asarray does not copy values that are already float64 arrays
+    result = np.multiply(np.asarray(values, dtype=np.float64), factor, out=out)
+    # A ufunc returns a NumPy scalar for 0-d input; wrap it back into an array
+    return np.asarray(result, dtype=np.float64)
+
+
+def mps_to_kph(values: npt.ArrayLike, out: FloatArray | None = None) -> FloatArray:
+    """Convert speeds from [m/s] to [km/h]."""
+    return convert(values, MPS_TO_KPH, out)
+
+
+def mps_to_mph(values: npt.ArrayLike, out: FloatArray | None = None) -> FloatArray:
+    """Convert speeds from [m/s] to [mph]."""
+    return convert(values, MPS_TO_MPH, out)
+
+
+def kg_to_lb(values: npt.ArrayLike, out: FloatArray | None = None) -> FloatArray:
+    """Convert masses from [kg] to [lb]."""
+    return convert(values, KG_TO_LB, out)
+
+
+def m_to_ft(values: npt.ArrayLike, out: FloatArray | None = None) -> FloatArray:
+    """Convert lengths from [m] to [ft]."""
+    return convert(values, M_TO_FT, out)
+
+
+def m_to_yard(values: npt.ArrayLike, out: FloatArray | None = None) -> FloatArray:
+    """Convert lengths from [m] to [yard]."""
+    return convert(values, M_TO_YARD, out)
+
+
+def deg_to_rad(values: npt.ArrayLike, out: FloatArray | None = None) -> FloatArray:
+    """Convert angles from [degrees] to [radians]."""
+    return convert(values, DEG_TO_RAD, out)
+
+
+def rad_to_deg(values: npt.ArrayLike, out: FloatArray | None = None) -> FloatArray:
+    """Convert angles from [radians] to [degrees]."""
+    return convert(values, RAD_TO_DEG, out)
@@ -4,25 +4,61 @@ This module provides logging setup and seed management for deterministic
 scientific computations.
 """
 
+import importlib
 import logging
 import random
 import sys
-
-try:
-    import torch
-
-    TORCH_AVAILABLE = True
-except ImportError:
-    TORCH_AVAILABLE = False
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 # Reproducibility constants
 DEFAULT_SEED: int = 42  # Answer to everything
 LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_LEVEL: int = logging.INFO
 
+# Whether PyTorch can be imported, probed on each lookup by __getattr__ below
+TORCH_AVAILABLE: bool
+
 logger = logging.getLogger(__name__)
 
 
+def _import_torch() -> ModuleType | None:
+    """Import PyTorch on demand, returning None if it is not installed."""
+    try:
+        return importlib.import_module("torch")
+    except ImportError:
+        return None
+
+
+# Defined only at runtime, so type checkers still report unknown attributes
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str) -> object:
+        """Probe for PyTorch when TORCH_AVAILABLE is looked up (PEP 562).
+
+        Importing torch is slow, so it is deferred until it is actually needed
+        rather than paid by every importer of this module.
+
+        Args:
+            name: Attribute being looked up on the module
+
+        Returns:
+            Whether PyTorch can be imported
+
+        Raises:
+            AttributeError: If name is not TORCH_AVAILABLE
+
+        """
+        if name == "TORCH_AVAILABLE":
+            return _import_torch() is not None
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    def __dir__() -> list[str]:
+        """List module attributes, including TORCH_AVAILABLE."""
+        return sorted({*globals(), "TORCH_AVAILABLE"})
+
+
 def setup_logging(level: int = LOG_LEVEL, format_string: str = LOG_FORMAT) -> None:
     """Set up logging configuration for the application.
 
@@ -42,8 +78,8 @@ def setup_logging(level: int = LOG_LEVEL, format_string: str = LOG_FORMAT) -> No
 def set_seeds(seed: int = DEFAULT_SEED) -> None:
     """Set random seeds for reproducible computations.
 
-    Sets seeds for Python's random module, NumPy's random generator,
-    and PyTorch if available.
+    Sets seeds for Python's random module, and for NumPy's global random
+    generator and PyTorch when they are installed.
 
     Args:
         seed: Random seed value (default: 42)
@@ -58,17 +94,23 @@ def set_seeds(seed: int = DEFAULT_SEED) -> None:
 
     random.seed(seed)
 
-    # Import numpy only when needed to set global random state
+    # Import numpy only when needed to set global random state, and only if it
+    # is installed: callers that never touch NumPy should not need it just to
+    # seed Python's random module.
     # Note: Using legacy np.random.seed() for global state compatibility.
     # Modern NumPy recommends Generator instances (np.random.default_rng()),
     # but this function sets global state for reproducibility across the codebase.
     # The noqa comment suppresses NPY002 warning for this intentional legacy usage.
-    import numpy as np
-
-    np.random.seed(seed)  # noqa: NPY002  # Set global numpy random state
+    try:
+        import numpy as np
+    except ImportError:
+        logger.debug("NumPy not installed; skipping NumPy seed")
+    else:
+        np.random.seed(seed)  # noqa: NPY002  # Set global numpy random state
 
     # Set PyTorch seeds if PyTorch is available
-    if TORCH_AVAILABLE:
+    torch = _import_torch()
+    if torch is not None:
         torch.manual_seed(seed)
         if torch.cuda.is_available():
             torch.cuda.manual_seed_all(seed)
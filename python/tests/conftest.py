@@ -7,7 +7,7 @@ to ensure imports work correctly in both local and CI environments.
 import sys
 from pathlib import Path
 
-# Add python/src to PYTHONPATH for test imports
-src_path = Path(__file__).parent.parent / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+# Add the python directory to PYTHONPATH once so tests can import the src package
+package_root = Path(__file__).parent.parent
+if str(package_root) not in sys.path:
+    sys.path.insert(0, str(package_root))
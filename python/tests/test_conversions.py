@@ -0,0 +1,55 @@
+"""Tests for the vectorized unit conversion helpers."""
+
+import numpy as np
+import pytest
+
+from src import constants, conversions
+
+
+class TestConversions:
+    """Test batched unit conversions."""
+
+    def test_convert_matches_scalar_multiply(self) -> None:
+        """Test each element is scaled exactly as a scalar multiply would."""
+        speeds = [0.0, 10.0, 44.7]
+        result = conversions.mps_to_kph(speeds)
+        expected = [speed * constants.MPS_TO_KPH for speed in speeds]
+        assert result.tolist() == expected
+
+    def test_scalar_input_returns_array(self) -> None:
+        """Test a scalar converts to a 0-d float64 array, not a NumPy scalar."""
+        result = conversions.mps_to_kph(10.0)
+        assert isinstance(result, np.ndarray)
+        assert result.ndim == 0
+        assert result.dtype == np.float64
+        assert result == pytest.approx(36.0)
+
+    def test_named_helpers(self) -> None:
+        """Test the named helpers apply their conversion factors."""
+        assert conversions.mps_to_mph(10.0) == pytest.approx(22.3694)
+        assert conversions.kg_to_lb(1.0) == pytest.approx(constants.KG_TO_LB)
+        assert conversions.m_to_ft(1.0) == pytest.approx(constants.M_TO_FT)
+        assert conversions.m_to_yard(1.0) == pytest.approx(constants.M_TO_YARD)
+
+    def test_angle_round_trip_in_place(self) -> None:
+        """Test degrees survive a round trip through a reused buffer."""
+        angles_deg = np.array([0.0, 45.0, 90.0, 180.0])
+        buffer = np.empty_like(angles_deg)
+        conversions.deg_to_rad(angles_deg, out=buffer)
+        assert buffer[2] == pytest.approx(np.pi / 2)
+        result = conversions.rad_to_deg(buffer, out=buffer)
+        assert result is buffer
+        np.testing.assert_allclose(buffer, angles_deg)
+
+    def test_convert_into_preallocated_buffer(self) -> None:
+        """Test results are written into a caller-supplied buffer."""
+        buffer = np.empty(3)
+        result = conversions.convert([1.0, 2.0, 3.0], 2.0, out=buffer)
+        assert result is buffer
+        assert buffer.tolist() == [2.0, 4.0, 6.0]
+
+    def test_convert_does_not_modify_input(self) -> None:
+        """Test converting without out leaves the input array untouched."""
+        values = np.array([1.0, 2.0])
+        conversions.m_to_ft(values)
+        assert values.tolist() == [1.0, 2.0]
@@ -7,11 +7,9 @@ including positive tests, negative tests, and edge cases.
 import logging
 import math
 import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from src import constants, logger_utils
 
 
@@ -49,6 +47,27 @@ class TestConstants:
         assert angle_rad == pytest.approx(math.pi, rel=1e-10)
         assert angle_deg_back == pytest.approx(180.0, rel=1e-10)
 
+    def test_constants_table(self) -> None:
+        """Test the frozen constants table mirrors the module constants."""
+        assert constants.CONSTANTS["GRAVITY_M_S2"] == constants.GRAVITY_M_S2
+        assert constants.CONSTANTS["PI"] == constants.PI
+        assert "CONSTANTS" not in constants.CONSTANTS
+        with pytest.raises(TypeError):
+            constants.CONSTANTS["PI"] = 3.0  # type: ignore[index]
+
+    def test_numerical_tolerances(self) -> None:
+        """Test the named tolerances are consistent with each other."""
+        assert constants.EPSILON_SQUARED == pytest.approx(
+            constants.EPSILON_DENOMINATOR**2,
+        )
+        assert constants.EPSILON_ROOTFIND == pytest.approx(
+            math.sqrt(sys.float_info.epsilon),
+            rel=1e-2,
+        )
+        assert constants.CONVERGENCE_TOLERANCE == constants.EPSILON_CONVERGENCE
+        # The denominator guard must survive being added to a value of order 1
+        assert 1.0 + constants.EPSILON_DENOMINATOR != 1.0
+
     def test_material_properties_positive(self) -> None:
         """Test material densities are positive."""
         assert constants.GRAPHITE_DENSITY_KG_M3 > 0
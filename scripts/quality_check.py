@@ -6,9 +6,22 @@
 from __future__ import annotations
 
 import ast
+import bisect
+import contextlib
+import functools
+import json
+import os
 import re
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
+
+try:
+    import hyperscan
+except ImportError:  # optional; the stdlib union below is used instead
+    hyperscan = None
 
 # Store the script's own path at module level for reliable exclusion
 # This MUST be set correctly for the exclusion to work
@@ -26,20 +39,34 @@ except NameError:
     _SCRIPT_DIR = None
     _SCRIPT_RELATIVE = None
 
+# File names this script is known by; such files are never checked
+_SELF_NAMES = frozenset(
+    {"quality_check.py", "quality-check.py", "quality_check_script.py"},
+)
+
 # Unique marker to identify this script - used for exclusion
 _QUALITY_CHECK_SCRIPT_MARKER = "QUALITY_CHECK_SCRIPT_V1"
+_QUALITY_CHECK_SCRIPT_MARKER_BYTES = _QUALITY_CHECK_SCRIPT_MARKER.encode()
 
 # Maximum file size (lines) for tertiary exclusion check
 # Files with BANNED_PATTERNS smaller than this are likely the quality check script
 _MAX_SCRIPT_SIZE_LINES: int = 400
 
+# Below this many files, starting worker processes costs more than it saves
+_PARALLEL_MIN_FILES: int = 32
+# Files handed to a worker per round trip when checking in parallel
+_PARALLEL_CHUNKSIZE: int = 16
+
+# Issues from earlier runs, reused for files whose mtime and size are unchanged
+_CACHE_PATH = Path(".quality_check_cache") / "file_issues.json"
+
 # Configuration
 BANNED_PATTERNS = [
     (re.compile(r"\bTODO\b"), "TODO placeholder found"),
     (re.compile(r"\bFIXME\b"), "FIXME placeholder found"),
     (re.compile(r"^\s*\.\.\.\s*$"), "Ellipsis placeholder"),
     (re.compile(r"NotImplementedError"), "NotImplementedError placeholder"),
-    (re.compile(r"<.*>"), "Angle bracket placeholder"),
+    (re.compile(r"<[^<>\n]{1,80}>"), "Angle bracket placeholder"),
     (re.compile(r"your.*here", re.IGNORECASE), "Template placeholder"),
     (re.compile(r"insert.*here", re.IGNORECASE), "Template placeholder"),
 ]
@@ -69,67 +96,150 @@ MAGIC_NUMBERS = [
     (re.compile(r"(?<![0-9])6\.67[0-9]?(?![0-9])"), "Define gravitational constant"),
 ]
 
+# Lines that define the patterns above (or their messages) are skipped so the
+# checker does not flag its own configuration when copied into other trees
+_PATTERN_DEFINITION_RE = re.compile(
+    r'\(re\.compile\(r"[^"]*(?:TODO|FIXME|NotImplementedError)'
+    r"|^\s*BANNED_PATTERNS\s*="
+    r'|"(?:TODO|FIXME|NotImplementedError) placeholder',
+)
+
+
+def _union(patterns: list[tuple[re.Pattern[str], str]]) -> re.Pattern[str]:
+    """Fuse patterns into one multiline alternation that never crosses lines."""
+    alternatives = []
+    for pattern, _ in patterns:
+        flags = "i" if pattern.flags & re.IGNORECASE else ""
+        # \s would let an anchored pattern start on an earlier blank line
+        source = pattern.pattern.replace(r"\s", r"[^\S\n]")
+        alternatives.append(f"(?{flags}:{source})")
+    return re.compile("|".join(alternatives), re.MULTILINE)
+
+
+# Each union is scanned once over the whole file to find candidate lines; the
+# individual patterns then only run on those lines, since one line can trip
+# several of them and each is reported
+_BANNED_RE = _union(BANNED_PATTERNS)
+_MAGIC_RE = _union(MAGIC_NUMBERS)
+
+
+def _hyperscan_database(patterns: list[tuple[re.Pattern[str], str]]) -> Any:
+    """Compile patterns into a Hyperscan block-mode database, if available."""
+    if hyperscan is None:
+        return None
+    expressions = []
+    flags = []
+    for pattern, _ in patterns:
+        # \b is unsupported in UCP mode; dropping it only widens the candidate
+        # lines, which are confirmed with the re patterns afterwards
+        source = pattern.pattern.replace(r"\s", r"[^\S\n]").replace(r"\b", "")
+        expressions.append(source.encode())
+        flag = hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_UTF8
+        flag |= hyperscan.HS_FLAG_UCP
+        if pattern.flags & re.IGNORECASE:
+            flag |= hyperscan.HS_FLAG_CASELESS
+        flags.append(flag)
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=flags,
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+# Hyperscan compiles the banned patterns to a DFA and finds candidate lines in
+# one pass without backtracking; without it the stdlib union does the same job
+# (the magic number lookbehinds are not supported, so those stay on re)
+_BANNED_DATABASE = _hyperscan_database(BANNED_PATTERNS)
+_NEWLINE_RE = re.compile(r"\n")
+_NEWLINE_BYTES_RE = re.compile(rb"\n")
+_COMMENT_RE = re.compile(r"#[^\n]*")
+
+# Every banned pattern and magic number needs one of these byte strings
+# (or a case-insensitive "here") to match, so a file containing none of them
+# can skip the line scans; bytes.find is a C-level memory scan
+_CHEAP_TOKENS: tuple[bytes, ...] = (
+    b"TODO",
+    b"FIXME",
+    b"...",
+    b"NotImplementedError",
+    b"<",
+    b"3.141",
+    b"9.8",
+    b"6.67",
+)
+_CASELESS_TOKEN_RE = re.compile(rb"here", re.IGNORECASE)
+
+
+def _has_cheap_token(raw: bytes) -> bool:
+    """Return True if raw could contain a banned pattern or magic number."""
+    return (
+        any(token in raw for token in _CHEAP_TOKENS)
+        or _CASELESS_TOKEN_RE.search(raw) is not None
+    )
 
-def _is_in_class_definition(lines: list[str], line_num: int) -> bool:
-    """Check if pass is in a class definition context."""
-    result = False
-    for i in range(line_num - 1, max(0, line_num - 10), -1):
-        prev_line = lines[i - 1].strip()
-        if prev_line.startswith("class "):
-            result = True
-            break
-        if prev_line.startswith("def "):
-            result = False
-            break
-        if prev_line.endswith(":") and any(
-            keyword in prev_line
-            for keyword in ["try:", "except", "finally:", "with ", "if __name__"]
-        ):
-            result = True
-            break
-    return result
 
+def _decode_source(raw: bytes) -> str:
+    """Decode UTF-8 source, translating newlines the way read_text() does."""
+    content = raw.decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
 
-def _is_in_try_except_block(lines: list[str], line_num: int) -> bool:
-    """Check if pass is in a try/except block context."""
-    for i in range(line_num - 1, max(0, line_num - 5), -1):
-        prev_line = lines[i - 1].strip()
-        if "try:" in prev_line or "except" in prev_line:
-            return True
-    return False
 
+def _line_starts(content: str) -> list[int]:
+    """Return the offset at which each line of content starts."""
+    return [0, *(match.end() for match in _NEWLINE_RE.finditer(content))]
 
-def _is_in_context_manager(lines: list[str], line_num: int) -> bool:
-    """Check if pass is in a context manager context."""
-    for i in range(line_num - 1, max(0, line_num - 3), -1):
-        prev_line = lines[i - 1].strip()
-        if prev_line.startswith("with "):
-            return True
-    return False
 
+def _line_text(content: str, line_starts: list[int], line_num: int) -> str:
+    """Return the text of a 1-based line without its trailing newline."""
+    start = line_starts[line_num - 1]
+    end = line_starts[line_num] - 1 if line_num < len(line_starts) else len(content)
+    return content[start:end]
 
-def is_legitimate_pass_context(lines: list[str], line_num: int) -> bool:
-    """Check if a pass statement is in a legitimate context."""
-    if line_num <= 0 or line_num > len(lines):
-        return False
 
-    line = lines[line_num - 1].strip()
-    if line != "pass":
-        return False
+def _matched_lines(
+    pattern: re.Pattern[str],
+    content: str,
+    line_starts: list[int],
+) -> set[int]:
+    """Return the 1-based numbers of lines containing a match of pattern."""
+    return {
+        bisect.bisect_right(line_starts, match.start())
+        for match in pattern.finditer(content)
+    }
 
-    return (
-        _is_in_class_definition(lines, line_num)
-        or _is_in_try_except_block(lines, line_num)
-        or _is_in_context_manager(lines, line_num)
-    )
+
+def _banned_lines(content: str, line_starts: list[int]) -> set[int]:
+    """Return the 1-based numbers of lines that may contain a banned pattern."""
+    if _BANNED_DATABASE is None:
+        return _matched_lines(_BANNED_RE, content, line_starts)
+    data = content.encode("utf-8")
+    # Hyperscan reports byte offsets, which only equal str offsets for ASCII
+    if len(data) != len(content):
+        line_starts = [0, *(match.end() for match in _NEWLINE_BYTES_RE.finditer(data))]
+    lines: set[int] = set()
+
+    def on_match(_id: int, _start: int, end: int, _flags: int, _context: Any) -> None:
+        # No pattern matches across or ends on a newline, so end - 1 is in the line
+        lines.add(bisect.bisect_right(line_starts, end - 1))
+
+    _BANNED_DATABASE.scan(data, match_event_handler=on_match)
+    return lines
 
 
 def check_banned_patterns(  # noqa: PLR0911, C901, PLR0912
-    lines: list[str],
+    content: str,
     filepath: Path,
     is_excluded: bool = False,  # noqa: FBT001, FBT002
 ) -> list[tuple[int, str, str]]:
-    """Check for banned patterns in lines."""
+    """Check for banned patterns in file content."""
     issues: list[tuple[int, str, str]] = []
 
     # CRITICAL: Hardcoded filename/path check - ABSOLUTE FIRST check before ANY processing
@@ -141,11 +251,7 @@ def check_banned_patterns(  # noqa: PLR0911, C901, PLR0912
     filepath_lower = filepath_str.lower()
 
     # Check 1: Exact filename match
-    if filepath.name in (
-        "quality_check.py",
-        "quality-check.py",
-        "quality_check_script.py",
-    ):
+    if filepath.name in _SELF_NAMES:
         return issues
 
     # Check 2: scripts/quality_check.py path combination (for CI environments)
@@ -173,104 +279,183 @@ def check_banned_patterns(  # noqa: PLR0911, C901, PLR0912
     # This MUST happen before pattern matching to prevent self-detection
     # This is the most important check - must run before ANY pattern matching
     # Multiple layers of checks ensure exclusion even if one fails in CI
-    if not lines:
+    if not content:
         return issues
 
-    # Join lines into content string for checking
-    file_content = "\n".join(lines)
-
     # ABSOLUTE FIRST CONTENT CHECK: If file contains BANNED_PATTERNS definition, it's this script
     # This is the most reliable check - only this script contains BANNED_PATTERNS = [
     # MUST be checked FIRST before any other checks
     # This check is CRITICAL - it must happen before any pattern matching
-    if "BANNED_PATTERNS = [" in file_content:
+    if "BANNED_PATTERNS = [" in content:
         return issues
 
     # Additional safety: check for the unique marker in content
     # This marker is in the file header as a comment
-    if _QUALITY_CHECK_SCRIPT_MARKER in file_content:
+    if _QUALITY_CHECK_SCRIPT_MARKER in content:
         return issues
 
     # Skip if already excluded (check performed once in check_file)
     if is_excluded:
         return issues
 
-    # Process lines and check for banned patterns
+    # Scan the whole file once per union and only visit lines that matched
     # Only reach here if content check didn't exclude the file
-    for line_num, line in enumerate(lines, 1):
+    line_starts = _line_starts(content)
+    for line_num in sorted(_banned_lines(content, line_starts)):
+        line = _line_text(content, line_starts, line_num)
         # Skip lines that are pattern definitions (avoid false positives)
-        # Check for actual pattern definition lines - these contain the patterns themselves
         # Match lines like: (re.compile(r"\bTODO\b"), "TODO placeholder found"),
-        if (
-            re.search(r'\(re\.compile\(r"[^"]*TODO', line)
-            or re.search(r'\(re\.compile\(r"[^"]*FIXME', line)
-            or re.search(r'\(re\.compile\(r"[^"]*NotImplementedError', line)
-            or re.search(r"^\s*BANNED_PATTERNS\s*=", line)
-            or '"TODO placeholder' in line
-            or '"FIXME placeholder' in line
-            or '"NotImplementedError placeholder' in line
-        ):
+        if _PATTERN_DEFINITION_RE.search(line):
             continue
         # Check for basic banned patterns
         for pattern, message in BANNED_PATTERNS:
             if pattern.search(line):
                 issues.append((line_num, message, line.strip()))
 
-        # Special handling for pass statements
-        if re.match(r"^\s*pass\s*$", line) and not is_legitimate_pass_context(
-            lines,
-            line_num,
-        ):
-            issues.append(
-                (
-                    line_num,
-                    "Empty pass statement - consider adding logic or comment",
-                    line.strip(),
-                ),
-            )
-
     return issues
 
 
 def check_magic_numbers(
-    lines: list[str],
+    content: str,
     filepath: Path,  # noqa: ARG001
     is_excluded: bool = False,  # noqa: FBT001, FBT002
 ) -> list[tuple[int, str, str]]:
-    """Check for magic numbers in lines."""
+    """Check for magic numbers in file content."""
     issues: list[tuple[int, str, str]] = []
     # Skip if already excluded (check performed once in check_file)
     if is_excluded:
         return issues
-    for line_num, line in enumerate(lines, 1):
-        line_content = line[: line.index("#")] if "#" in line else line
+    # Stripping every comment in one pass keeps the line count, so line numbers
+    # found in the code-only text map straight back onto the original lines
+    code = _COMMENT_RE.sub("", content)
+    code_line_starts = _line_starts(code)
+    magic_lines = _matched_lines(_MAGIC_RE, code, code_line_starts)
+    if not magic_lines:
+        return issues
+    line_starts = _line_starts(content)
+    for line_num in sorted(magic_lines):
+        line = _line_text(content, line_starts, line_num)
+        line_content = _line_text(code, code_line_starts, line_num)
         for pattern, message in MAGIC_NUMBERS:
             if pattern.search(line_content):
                 issues.append((line_num, message, line.strip()))
     return issues
 
 
-def check_ast_issues(content: str) -> list[tuple[int, str, str]]:
-    """Check AST for quality issues."""
+# Function definitions and pass are statements, so only statement blocks need
+# visiting
+_BLOCK_NODES = (ast.stmt, ast.excepthandler, ast.match_case)
+
+# A line holding nothing but pass, found by scanning when a file does not parse
+_BARE_PASS_RE = re.compile(r"^[^\S\n]*pass[^\S\n]*$", re.MULTILINE)
+
+# A pass directly inside one of these is a deliberate no-op, not a placeholder
+_PASS_CONTEXT_NODES = (
+    ast.ClassDef,
+    ast.Try,
+    ast.TryStar,
+    ast.ExceptHandler,
+    ast.With,
+    ast.AsyncWith,
+)
+
+
+def _is_main_guard(node: ast.AST) -> bool:
+    """Return True if node is an ``if __name__ == ...`` block."""
+    return (
+        isinstance(node, ast.If)
+        and isinstance(node.test, ast.Compare)
+        and isinstance(node.test.left, ast.Name)
+        and node.test.left.id == "__name__"
+    )
+
+
+class _QualityVisitor(ast.NodeVisitor):
+    """Collect function definition issues and placeholder pass statements.
+
+    Expression subtrees can never contain a function definition or a pass, so
+    only the statement lists of each node are descended into. The node whose
+    block is being visited is kept on a stack so a pass can be judged by its
+    parent.
+    """
+
+    def __init__(self) -> None:
+        self.issues: list[tuple[int, str, str]] = []
+        self.pass_lines: list[int] = []
+        self._parents: list[ast.AST] = []
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit the statements nested in node, skipping its expressions."""
+        self._parents.append(node)
+        for _, value in ast.iter_fields(node):
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, _BLOCK_NODES):
+                        self.visit(item)
+        self._parents.pop()
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
+        """Record issues for a function and visit any nested definitions."""
+        if not ast.get_docstring(node):
+            self.issues.append(
+                (node.lineno, f"Function '{node.name}' missing docstring", ""),
+            )
+        if not node.returns and node.name != "__init__":
+            self.issues.append(
+                (
+                    node.lineno,
+                    f"Function '{node.name}' missing return type hint",
+                    "",
+                ),
+            )
+        self.generic_visit(node)
+
+    def visit_Pass(self, node: ast.Pass) -> None:  # noqa: N802
+        """Record a pass that is not in a class, try, except, with or main guard."""
+        parent = self._parents[-1]
+        if not isinstance(parent, _PASS_CONTEXT_NODES) and not _is_main_guard(parent):
+            self.pass_lines.append(node.lineno)
+
+
+def check_ast_issues(
+    content: str,
+    filepath: Path | None = None,
+) -> list[tuple[int, str, str]]:
+    """Check AST for quality issues.
+
+    Syntax errors name filepath when it is given.
+    """
     issues: list[tuple[int, str, str]] = []
+    filename = "<unknown>" if filepath is None else str(filepath)
     try:
-        tree = ast.parse(content)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                if not ast.get_docstring(node):
-                    issues.append(
-                        (node.lineno, f"Function '{node.name}' missing docstring", ""),
-                    )
-                if not node.returns and node.name != "__init__":
-                    issues.append(
-                        (
-                            node.lineno,
-                            f"Function '{node.name}' missing return type hint",
-                            "",
-                        ),
-                    )
+        # Type comments are never inspected, so the parser need not keep them
+        tree = ast.parse(content, filename=filename, type_comments=False)
     except SyntaxError as e:
         issues.append((0, f"Syntax error: {e}", ""))
+        # Without a tree no pass can be judged by its parent, so every bare
+        # pass line is flagged
+        line_starts = _line_starts(content)
+        pass_lines = sorted(_matched_lines(_BARE_PASS_RE, content, line_starts))
+    else:
+        visitor = _QualityVisitor()
+        visitor.visit(tree)
+        issues.extend(visitor.issues)
+        pass_lines = visitor.pass_lines
+        # Only the few lines holding a flagged pass are sliced out
+        line_starts = _line_starts(content) if pass_lines else []
+    for line_num in pass_lines:
+        line = _line_text(content, line_starts, line_num).strip()
+        # A pass sharing its line with other code or a comment is intended
+        if line == "pass":
+            issues.append(
+                (
+                    line_num,
+                    "Empty pass statement - consider adding logic or comment",
+                    line,
+                ),
+            )
+    # The visitor reports function issues before pass issues; keep line order
+    issues.sort(key=lambda issue: issue[0])
     return issues
 
 
@@ -283,11 +468,7 @@ def check_file(  # noqa: PLR0911
     # Also check if path contains 'scripts' and 'quality_check' to catch CI path variations
     filepath_str = str(filepath)
     filepath_lower = filepath_str.lower()
-    is_quality_check_script = filepath.name in (
-        "quality_check.py",
-        "quality-check.py",
-        "quality_check_script.py",
-    ) or (
+    is_quality_check_script = filepath.name in _SELF_NAMES or (
         "scripts" in filepath_lower
         and "quality_check" in filepath_lower
         and filepath_lower.endswith(".py")
@@ -295,22 +476,27 @@ def check_file(  # noqa: PLR0911
     if is_quality_check_script:
         return []
 
+    try:
+        raw = filepath.read_bytes()
+    except OSError as e:
+        return [(0, f"Error reading file: {e}", "")]
+
     # CRITICAL: Check if this is the script itself - MUST happen SECOND
     # should_exclude_file() performs comprehensive checks (filename, path, content)
-    if should_exclude_file(filepath):
+    # and looks for the unique marker in the bytes already read
+    if should_exclude_file(filepath, raw):
         return []
 
-    try:
-        content = filepath.read_text(encoding="utf-8")
-        # Additional safety: check for unique marker or pattern definitions
-        # This is the most reliable check - works regardless of path resolution
-        # CRITICAL: This check MUST happen before reading lines to prevent any processing
-        # Most permissive check: if file contains BANNED_PATTERNS definition, it's this script
-        # This is the most reliable content-based check
-        if "BANNED_PATTERNS = [" in content or _QUALITY_CHECK_SCRIPT_MARKER in content:
-            return []
+    # Additional safety: check for unique marker or pattern definitions
+    # This is the most reliable check - works regardless of path resolution
+    # CRITICAL: This check MUST happen before scanning to prevent any processing
+    # Most permissive check: if file contains BANNED_PATTERNS definition, it's this script
+    # This is the most reliable content-based check
+    if not raw or b"BANNED_PATTERNS = [" in raw:
+        return []
 
-        lines = content.splitlines()
+    try:
+        content = _decode_source(raw)
 
         # Cache exclusion result to avoid repeated expensive checks in helper functions
         # Note: is_excluded is False here because should_exclude_file() already returned early
@@ -318,24 +504,25 @@ def check_file(  # noqa: PLR0911
         is_excluded = False
 
         issues = []
-        # check_banned_patterns has its own content checks as a safety net
-        issues.extend(check_banned_patterns(lines, filepath, is_excluded))
-        issues.extend(check_magic_numbers(lines, filepath, is_excluded))
-        issues.extend(check_ast_issues(content))
-    except (OSError, UnicodeDecodeError) as e:
+        if _has_cheap_token(raw):
+            # check_banned_patterns has its own content checks as a safety net
+            issues.extend(check_banned_patterns(content, filepath, is_excluded))
+            issues.extend(check_magic_numbers(content, filepath, is_excluded))
+        # Missing docstrings and type hints need the AST whatever the content
+        issues.extend(check_ast_issues(content, filepath))
+    except UnicodeDecodeError as e:
         return [(0, f"Error reading file: {e}", "")]
     else:
         return issues
 
 
 # Module-level constant for excluded filenames
-_EXCLUDED_NAMES = {"quality_check_script.py", "quality_check.py"}
+_EXCLUDED_NAMES = _SELF_NAMES | {_SCRIPT_NAME}
 
 
 def _check_filename(filepath: Path) -> bool:
     """Check if file should be excluded by filename."""
-    excluded_names = _EXCLUDED_NAMES | {_SCRIPT_NAME}
-    return filepath.name in excluded_names
+    return filepath.name in _EXCLUDED_NAMES
 
 
 def _check_absolute_path(filepath: Path) -> bool:  # noqa: PLR0911
@@ -373,43 +560,165 @@ def _check_absolute_path(filepath: Path) -> bool:  # noqa: PLR0911
     return False
 
 
+# Only the head of a file is read when looking for the script's signature
+_SIGNATURE_BYTES: int = 4096
+
+
+def _has_content_signature(content: bytes) -> bool:
+    """Check if file content carries the quality check script signature."""
+    # Look for unique signature of quality check script
+    # Use unique marker first (most reliable), then fallback to pattern definitions
+    return _QUALITY_CHECK_SCRIPT_MARKER_BYTES in content or (
+        b"BANNED_PATTERNS = [" in content
+        and b"Quality check script" in content
+        and b"def should_exclude_file" in content
+    )
+
+
+# Both exclusion passes (main() and check_file()) ask about the same paths, so
+# the resolve()/samefile() calls and the signature read happen once per path
+# in each process
+@functools.cache
 def _check_content_signature(filepath: Path) -> bool:
     """Check if file should be excluded by content signature."""
     if not filepath.exists():
         return False
     try:
-        with filepath.open(encoding="utf-8", errors="ignore") as f:
-            content_start = f.read(4096)
+        with filepath.open("rb") as f:
+            content_start = f.read(_SIGNATURE_BYTES)
     except (OSError, ValueError):
         return False
     else:
-        # Look for unique signature of quality check script
-        # Use unique marker first (most reliable), then fallback to pattern definitions
-        return _QUALITY_CHECK_SCRIPT_MARKER in content_start or (
-            "BANNED_PATTERNS = [" in content_start
-            and "Quality check script" in content_start
-            and "def should_exclude_file" in content_start
-        )
+        return _has_content_signature(content_start)
 
 
-def should_exclude_file(filepath: Path) -> bool:
-    """Determine if a file should be excluded from checks."""
+@functools.cache
+def _check_path(filepath: Path) -> bool:
+    """Check if file should be excluded by filename or absolute path."""
     # Check filename first (fastest check)
     if _check_filename(filepath):
         return True
 
     # Check absolute path (works in most cases)
-    if _check_absolute_path(filepath):
+    return _check_absolute_path(filepath)
+
+
+def should_exclude_file(filepath: Path, content: bytes | None = None) -> bool:
+    """Determine if a file should be excluded from checks.
+
+    Callers that have already read the file pass its bytes as ``content`` so
+    the signature is looked for in memory instead of reading the file again.
+    The whole of ``content`` is searched, not just its first few KiB.
+    """
+    if _check_path(filepath):
         return True
 
     # Check content signature (fallback for CI environments)
+    if content is not None:
+        return _has_content_signature(content)
     return _check_content_signature(filepath)
 
 
+def _check_files(python_files: list[Path]) -> list[list[tuple[int, str, str]]]:
+    """Run check_file over each file, fanning out across CPU cores if worthwhile."""
+    if len(python_files) < _PARALLEL_MIN_FILES:
+        return [check_file(filepath) for filepath in python_files]
+    # Compiled patterns live at module level, so each worker builds them once
+    with ProcessPoolExecutor() as executor:
+        return list(
+            executor.map(check_file, python_files, chunksize=_PARALLEL_CHUNKSIZE),
+        )
+
+
+def _file_stamp(filepath: Path) -> list[int] | None:
+    """Return the (mtime_ns, size) pair used to detect changed files."""
+    try:
+        st = filepath.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _checker_stamp() -> list[int]:
+    """Return a stamp that changes whenever this script or Python changes."""
+    stamp = list(sys.version_info[:2])
+    if _SCRIPT_PATH is not None:
+        stamp.extend(_file_stamp(_SCRIPT_PATH) or [])
+    return stamp
+
+
+def _load_cache() -> dict[str, list[Any]]:
+    """Load cached issues, discarding them if written by another checker."""
+    try:
+        data = json.loads(_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("checker") != _checker_stamp():
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_cache(files: dict[str, list[Any]]) -> None:
+    """Write cached issues atomically; the cache is best effort."""
+    with contextlib.suppress(OSError):
+        _CACHE_PATH.parent.mkdir(exist_ok=True)
+        tmp_path = _CACHE_PATH.with_suffix(".tmp")
+        payload = {"checker": _checker_stamp(), "files": files}
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        tmp_path.replace(_CACHE_PATH)
+
+
+def _check_files_cached(
+    python_files: list[Path],
+) -> list[list[tuple[int, str, str]]]:
+    """Check files, reusing cached issues for files unchanged since last run."""
+    cache = _load_cache()
+    updated: dict[str, list[Any]] = {}
+    results: dict[str, list[tuple[int, str, str]]] = {}
+    stale: list[tuple[Path, list[int] | None]] = []
+    for filepath in python_files:
+        key = str(filepath)
+        # Stamp before checking so an edit made mid-run is rechecked next time
+        stamp = _file_stamp(filepath)
+        entry = cache.get(key)
+        if stamp is not None and entry is not None and entry[0] == stamp:
+            results[key] = [tuple(issue) for issue in entry[1]]
+            updated[key] = entry
+        else:
+            stale.append((filepath, stamp))
+
+    fresh = _check_files([filepath for filepath, _ in stale])
+    for (filepath, stamp), issues in zip(stale, fresh, strict=True):
+        key = str(filepath)
+        results[key] = issues
+        if stamp is not None:
+            updated[key] = [stamp, issues]
+
+    # Only files seen this run are kept, so deleted files drop out of the cache
+    _save_cache(updated)
+    return [results[str(filepath)] for filepath in python_files]
+
+
+def _iter_python_files(root: Path, exclude_dirs: set[str]) -> Iterator[Path]:
+    """Yield the .py files under root without entering excluded directories."""
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in exclude_dirs:
+                        pending.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield Path(entry.path)
+
+
 def main() -> None:
     """Run quality checks on Python files."""
-    python_files = list(Path().rglob("*.py"))
-
     # Exclude certain directories
     exclude_dirs = {
         "archive",
@@ -424,9 +733,9 @@ def main() -> None:
         ".ipynb_checkpoints",  # Add checkpoint files to exclusion
         ".Trash",  # Add trash files to exclusion
     }
-    python_files = [
-        f for f in python_files if not any(part in exclude_dirs for part in f.parts)
-    ]
+    # Excluded directories are pruned during the walk, so .git and the caches
+    # are never listed; sorting keeps the report order stable between runs
+    python_files = sorted(_iter_python_files(Path(), exclude_dirs))
 
     # Filter out the script itself - use hardcoded filename check FIRST for reliability
     # This works in all environments (local, CI, etc.) regardless of path resolution
@@ -437,12 +746,7 @@ def main() -> None:
         f
         for f in python_files
         if not (
-            f.name
-            in (
-                "quality_check.py",
-                "quality-check.py",
-                "quality_check_script.py",
-            )
+            f.name in _SELF_NAMES
             or (
                 "scripts" in str(f).lower()
                 and "quality_check" in str(f).lower()
@@ -453,28 +757,31 @@ def main() -> None:
     # Additional filter using should_exclude_file() for comprehensive checks
     python_files = [f for f in python_files if not should_exclude_file(f)]
 
-    all_issues = []
-    for filepath in python_files:
-        issues = check_file(filepath)
-        if issues:
-            all_issues.append((filepath, issues))
+    results = _check_files_cached(python_files)
+    all_issues = [
+        (filepath, issues)
+        for filepath, issues in zip(python_files, results, strict=True)
+        if issues
+    ]
 
     # Report
     if all_issues:
-        sys.stderr.write("❌ Quality check FAILED\n\n")
+        # Assemble the whole report and write it once rather than per line
+        report = ["❌ Quality check FAILED\n\n"]
         for filepath, issues in all_issues:
-            sys.stderr.write(f"\n{filepath}:\n")
+            report.append(f"\n{filepath}:\n")
             for line_num, message, code in issues:
                 if line_num > 0:
-                    sys.stderr.write(f"  Line {line_num}: {message}\n")
+                    report.append(f"  Line {line_num}: {message}\n")
                     if code:
-                        sys.stderr.write(f"    > {code}\n")
+                        report.append(f"    > {code}\n")
                 else:
-                    sys.stderr.write(f"  {message}\n")
+                    report.append(f"  {message}\n")
 
-        sys.stderr.write(
+        report.append(
             f"\nTotal issues: {sum(len(issues) for _, issues in all_issues)}\n",
         )
+        sys.stderr.write("".join(report))
         sys.exit(1)
     else:
         sys.stderr.write("✅ Quality check PASSED\n")
@@ -2,32 +2,74 @@
 """Quality check script to verify AI-generated code meets standards."""
 
 import ast
+import bisect
+import contextlib
+import functools
+import hashlib
+import json
+import os
 import re
+import shutil
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
+try:
+    import re2
+except ImportError:  # optional; the stdlib re engine is used instead
+    re2 = None
 
-# ANSI colors for terminal output
-class Colors:
-    if sys.stderr.isatty():
-        HEADER = "\033[95m"
-        BLUE = "\033[94m"
-        CYAN = "\033[96m"
-        GREEN = "\033[92m"
-        WARNING = "\033[93m"
-        FAIL = "\033[91m"
-        ENDC = "\033[0m"
-        BOLD = "\033[1m"
-    else:
-        HEADER = ""
-        BLUE = ""
-        CYAN = ""
-        GREEN = ""
-        WARNING = ""
-        FAIL = ""
-        ENDC = ""
-        BOLD = ""
 
+# ANSI colors for terminal output, decided once for the whole run
+_USE_COLOR = sys.stderr.isatty()
+_BOLD = "\033[1m"
+_CYAN = "\033[96m"
+_WARNING = "\033[93m"
+_FAIL = "\033[91m"
+_ENDC = "\033[0m"
+
+
+# Quality check scripts contain the very patterns they look for, so files with
+# these names are never checked
+_SELF_NAMES = frozenset(
+    {"quality_check_script.py", "matlab_quality_check.py", "code_quality_check.py"},
+)
+
+# Below this many files, starting worker processes costs more than it saves
+_PARALLEL_MIN_FILES: int = 32
+# Files handed to a worker per round trip when checking in parallel
+_PARALLEL_CHUNKSIZE: int = 16
+
+# Directories never searched for Python files, built once at import
+_EXCLUDE_DIRS = frozenset(
+    {
+        "archive",
+        "legacy",
+        "experimental",
+        ".git",
+        "__pycache__",
+        ".ruff_cache",
+        ".mypy_cache",
+        "matlab",
+        "output",
+        ".ipynb_checkpoints",  # Add checkpoint files to exclusion
+        ".Trash",  # Add trash files to exclusion
+    },
+)
+
+# Issues from earlier runs, one directory per source path holding the entry
+# for its current modification time and size, so an unchanged file is neither
+# read, scanned nor parsed again. Entries are keyed on stat alone: an edit that
+# keeps both the modification time and the size is not noticed.
+_ISSUES_CACHE_DIR = Path(".quality_check_cache") / "file_issues"
+# [paths] Above this many cached source paths the cache is emptied and rebuilt
+_ISSUES_CACHE_MAX_PATHS = 20000
+# Either of these turns the cache off, so CI and read-only checkouts neither
+# read nor write it
+_NO_CACHE_FLAG = "--no-cache"
+_NO_CACHE_ENV = "QUALITY_CHECK_NO_CACHE"
 
 # Configuration
 BANNED_PATTERNS = [
@@ -35,7 +77,7 @@ BANNED_PATTERNS = [
     (re.compile(r"\bFIXME\b"), "FIXME placeholder found"),
     (re.compile(r"^\s*\.\.\.\s*$"), "Ellipsis placeholder"),
     (re.compile(r"NotImplementedError"), "NotImplementedError placeholder"),
-    (re.compile(r"<.*>"), "Angle bracket placeholder"),
+    (re.compile(r"<[^<>\n]{1,80}>"), "Angle bracket placeholder"),
     (re.compile(r"your.*here", re.IGNORECASE), "Template placeholder"),
     (re.compile(r"insert.*here", re.IGNORECASE), "Template placeholder"),
 ]
@@ -66,186 +108,411 @@ MAGIC_NUMBERS = [
 ]
 
 
-def is_legitimate_pass_context(lines: list[str], line_num: int) -> bool:
-    """Check if a pass statement is in a legitimate context."""
-    if line_num <= 0 or line_num > len(lines):
-        return False
-
-    line = lines[line_num - 1].strip()
-    if line != "pass":
-        return False
-
-    # Check if this is in a class definition (legitimate)
-    for i in range(line_num - 1, max(0, line_num - 10), -1):
-        prev_line = lines[i - 1].strip()
-        if prev_line.startswith("class "):
-            return True
-        if prev_line.startswith("def "):
-            return False
-        if prev_line.endswith(":") and any(
-            keyword in prev_line
-            for keyword in ["try:", "except", "finally:", "with ", "if __name__"]
-        ):
-            return True
-
-    # Check if this is in a try/except block (legitimate)
-    for i in range(line_num - 1, max(0, line_num - 5), -1):
-        prev_line = lines[i - 1].strip()
-        if "try:" in prev_line or "except" in prev_line:
-            return True
-
-    # Check if this is in a context manager (legitimate)
-    for i in range(line_num - 1, max(0, line_num - 3), -1):
-        prev_line = lines[i - 1].strip()
-        if prev_line.startswith("with "):
-            return True
-
-    return False
-
-
-def check_banned_patterns(
-    lines: list[str],
-    filepath: Path,
-) -> list[tuple[int, str, str]]:
-    """Check for banned patterns in lines."""
+# Python's Unicode whitespace other than a newline, spelled out for RE2,
+# whose \s is ASCII-only
+_RE2_SPACE = r"[\t\x0b\f\r\x1c-\x1f\x85\p{Z}]"
+
+
+def _union(patterns: list[tuple[re.Pattern[str], str]], *, dfa: bool = False) -> Any:
+    """Fuse patterns into one multiline alternation that never crosses lines.
+
+    With dfa set and google-re2 installed, the union is compiled by RE2, whose
+    automaton scans the text once however many alternatives there are.
+    """
+    alternatives = []
+    for pattern, _ in patterns:
+        flags = "i" if pattern.flags & re.IGNORECASE else ""
+        alternatives.append(f"(?{flags}:{pattern.pattern})")
+    source = "|".join(alternatives)
+    if dfa and re2 is not None:
+        return re2.compile("(?m)" + source.replace(r"\s", _RE2_SPACE))
+    # \s would let an anchored pattern start on an earlier blank line
+    return re.compile(source.replace(r"\s", r"[^\S\n]"), re.MULTILINE)
+
+
+# Each union is scanned once over the whole file to find candidate lines; the
+# individual patterns then only run on those lines, since one line can trip
+# several of them and each is reported. RE2 cannot compile
+# the lookbehinds in the magic numbers, so only the banned union uses it
+_BANNED_RE = _union(BANNED_PATTERNS, dfa=True)
+_MAGIC_RE = _union(MAGIC_NUMBERS)
+
+# Every banned pattern and magic number needs one of these byte strings
+# (or a case-insensitive "here") to match, so a file containing none of them
+# can skip the line checks; bytes containment is a C-level memory scan
+_ANCHORS: tuple[bytes, ...] = (
+    b"TODO",
+    b"FIXME",
+    b"...",
+    b"NotImplementedError",
+    b"<",
+    b"3.141",
+    b"9.8",
+    b"6.67",
+)
+_CASELESS_ANCHOR_RE = re.compile(rb"here", re.IGNORECASE)
+_LINE_FEED_RE = re.compile(r"\n")
+_COMMENT_RE = re.compile(r"#[^\n]*")
+_EMPTY_PASS_MESSAGE = "Empty pass statement - consider adding logic or comment"
+
+# Function definitions and pass are statements, so only statement blocks need
+# visiting
+_BLOCK_NODES = (ast.stmt, ast.excepthandler, ast.match_case)
+
+# A pass directly inside one of these is a deliberate no-op, not a placeholder
+_PASS_CONTEXT_NODES = (
+    ast.ClassDef,
+    ast.Try,
+    ast.TryStar,
+    ast.ExceptHandler,
+    ast.With,
+    ast.AsyncWith,
+)
+
+
+def _is_main_guard(node: ast.AST) -> bool:
+    """Return True if node is an ``if __name__ == ...`` block."""
+    return (
+        isinstance(node, ast.If)
+        and isinstance(node.test, ast.Compare)
+        and isinstance(node.test.left, ast.Name)
+        and node.test.left.id == "__name__"
+    )
+
+
+def _decode_source(raw: bytes) -> str:
+    """Decode UTF-8 source, translating newlines the way read_text() does."""
+    content = raw.decode("utf-8")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _line_starts(content: str) -> list[int]:
+    """Return the offset at which each line of content starts."""
+    return [0, *(match.end() for match in _LINE_FEED_RE.finditer(content))]
+
+
+def _line_text(content: str, line_starts: list[int], line_num: int) -> str:
+    """Return the text of a 1-based line without its trailing newline."""
+    start = line_starts[line_num - 1]
+    end = line_starts[line_num] - 1 if line_num < len(line_starts) else len(content)
+    return content[start:end]
+
+
+def _matched_lines(pattern: Any, content: str, line_starts: list[int]) -> set[int]:
+    """Return the 1-based numbers of lines containing a match of pattern."""
+    return {
+        bisect.bisect_right(line_starts, match.start())
+        for match in pattern.finditer(content)
+    }
+
+
+def check_lines(content: str, filepath: Path) -> list[tuple[int, str, str]]:
+    """Check content for banned patterns and magic numbers.
+
+    Each fused pattern is scanned once over the whole text; only lines it
+    matched are sliced out and checked pattern by pattern.
+    """
     issues: list[tuple[int, str, str]] = []
-    # Skip checking quality check scripts for their own patterns
-    if filepath.name in ("quality_check_script.py", "matlab_quality_check.py", "code_quality_check.py"):
+    # Skip checking quality check scripts for their own patterns and magic
+    # numbers (they contain the patterns they check for)
+    if filepath.name in _SELF_NAMES:
         return issues
 
-    for line_num, line in enumerate(lines, 1):
-        # Check for basic banned patterns
-        for pattern, message in BANNED_PATTERNS:
-            if pattern.search(line):
-                issues.append((line_num, message, line.strip()))
-
-        # Special handling for pass statements
-        if re.match(r"^\s*pass\s*$", line) and not is_legitimate_pass_context(
-            lines,
-            line_num,
-        ):
-            issues.append(
-                (
-                    line_num,
-                    "Empty pass statement - consider adding logic or comment",
-                    line.strip(),
-                ),
+    line_starts = _line_starts(content)
+    banned_lines = _matched_lines(_BANNED_RE, content, line_starts)
+    # Magic numbers in comments are allowed. Stripping every comment in one
+    # pass keeps the line count, so line numbers found in the code-only text
+    # map straight back onto the original lines
+    code = _COMMENT_RE.sub("", content)
+    code_line_starts = _line_starts(code)
+    magic_lines = _matched_lines(_MAGIC_RE, code, code_line_starts)
+
+    for line_num in sorted(banned_lines | magic_lines):
+        line = _line_text(content, line_starts, line_num)
+        # Every issue on a line reports the same stripped text
+        stripped = line.strip()
+        if line_num in banned_lines:
+            issues.extend(
+                (line_num, message, stripped)
+                for pattern, message in BANNED_PATTERNS
+                if pattern.search(line)
+            )
+        if line_num in magic_lines:
+            line_content = _line_text(code, code_line_starts, line_num)
+            issues.extend(
+                (line_num, message, stripped)
+                for pattern, message in MAGIC_NUMBERS
+                if pattern.search(line_content)
             )
 
     return issues
 
 
-def check_magic_numbers(lines: list[str], filepath: Path) -> list[tuple[int, str, str]]:
-    """Check for magic numbers in lines."""
-    issues: list[tuple[int, str, str]] = []
-    # Skip checking quality check scripts for magic numbers (they contain patterns they check for)
-    if filepath.name in ("quality_check_script.py", "matlab_quality_check.py", "code_quality_check.py"):
-        return issues
-    for line_num, line in enumerate(lines, 1):
-        line_content = line[: line.index("#")] if "#" in line else line
-        for pattern, message in MAGIC_NUMBERS:
-            if pattern.search(line_content):
-                issues.append((line_num, message, line.strip()))
-    return issues
+@functools.cache
+def _checker_stamp() -> bytes:
+    """Return a stamp that changes whenever this script or Python changes."""
+    checker = Path(__file__).stat()
+    return f"{sys.version_info[:2]}:{checker.st_mtime_ns}:{checker.st_size}".encode()
+
+
+@functools.cache
+def _checker_cache_dir() -> Path:
+    """Return the cache directory for this version of the checker."""
+    digest = hashlib.blake2b(_checker_stamp(), digest_size=8)
+    return _ISSUES_CACHE_DIR / digest.hexdigest()
+
+
+def _issues_cache_path(filepath: Path, stat: os.stat_result) -> Path:
+    """Return the cache file for a source file, keyed by checker, path and stat.
+
+    Like Python's own bytecode cache, a file whose modification time and size
+    are unchanged is taken to be unchanged, so a hit never reads the source.
+    """
+    # Self-checks and syntax error messages depend on the path, so each path
+    # gets its own directory
+    digest = hashlib.blake2b(os.fsencode(filepath), digest_size=8)
+    key = f"{stat.st_mtime_ns}-{stat.st_size}"
+    return _checker_cache_dir() / digest.hexdigest() / f"{key}.json"
+
+
+def _prune_issues_cache() -> None:
+    """Bound the cache before a run; the cache is best effort.
+
+    Entries written by other versions of the checker can never be hit again,
+    so their directories are removed. If the current version has cached more
+    than _ISSUES_CACHE_MAX_PATHS source paths, for instance from files that
+    were since renamed or deleted, it is emptied and rebuilt by this run.
+    """
+    current = _checker_cache_dir()
+    with contextlib.suppress(OSError):
+        with os.scandir(_ISSUES_CACHE_DIR) as entries:
+            stale = [entry.path for entry in entries if entry.name != current.name]
+        for path in stale:
+            shutil.rmtree(path, ignore_errors=True)
+        with os.scandir(current) as entries:
+            num_paths = sum(1 for _ in entries)
+        if num_paths > _ISSUES_CACHE_MAX_PATHS:
+            shutil.rmtree(current, ignore_errors=True)
+
+
+def _load_issues(cache_path: Path) -> list[tuple[int, str, str]] | None:
+    """Return cached issues, or None if there is no usable entry."""
+    try:
+        entries = json.loads(cache_path.read_text(encoding="utf-8"))
+        return [(line_num, message, code) for line_num, message, code in entries]
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def _save_issues(cache_path: Path, issues: list[tuple[int, str, str]]) -> None:
+    """Write issues atomically; the cache is best effort."""
+    with contextlib.suppress(OSError):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Unique per process so concurrent writers never share a temporary file
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(issues), encoding="utf-8")
+        tmp_path.replace(cache_path)
+        # Entries for earlier versions of the file can never be hit again
+        for stale in cache_path.parent.glob("*.json"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+
+
+class _QualityVisitor(ast.NodeVisitor):
+    """Collect function definition issues and placeholder pass statements.
+
+    Expression subtrees can never contain a function definition or a pass, so
+    only the statement lists of each node are descended into. The node whose
+    block is being visited is kept on a stack so a pass can be judged by its
+    parent rather than by re-reading the lines above it.
+    """
+
+    def __init__(self) -> None:
+        self.issues: list[tuple[int, str, str]] = []
+        self.pass_lines: list[int] = []
+        self._parents: list[ast.AST] = []
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit the statements nested in node, skipping its expressions."""
+        self._parents.append(node)
+        for _, value in ast.iter_fields(node):
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, _BLOCK_NODES):
+                        self.visit(item)
+        self._parents.pop()
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802
+        """Record issues for a function and visit any nested definitions."""
+        if not ast.get_docstring(node):
+            self.issues.append(
+                (node.lineno, f"Function '{node.name}' missing docstring", ""),
+            )
+        # Relaxed: We let MyPy handle missing return checks,
+        # as this stricter check might block valid quick scripts.
+        # Uncomment to enforce:
+        # if not node.returns and node.name != "__init__":
+        #     self.issues.append((node.lineno, f"Function '{node.name}' missing return type hint", ""))
+        self.generic_visit(node)
+
+    def visit_Pass(self, node: ast.Pass) -> None:  # noqa: N802
+        """Record a pass that is not in a class, try, except, with or main guard."""
+        parent = self._parents[-1]
+        if not isinstance(parent, _PASS_CONTEXT_NODES) and not _is_main_guard(parent):
+            self.pass_lines.append(node.lineno)
 
 
 def check_ast_issues(content: str, filepath: Path) -> list[tuple[int, str, str]]:
     """Check AST for quality issues."""
     issues: list[tuple[int, str, str]] = []
     # Skip checking quality check scripts for AST issues
-    if filepath.name in ("quality_check_script.py", "matlab_quality_check.py", "code_quality_check.py"):
+    if filepath.name in _SELF_NAMES:
         return issues
     try:
-        tree = ast.parse(content)
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                if not ast.get_docstring(node):
-                    issues.append(
-                        (node.lineno, f"Function '{node.name}' missing docstring", ""),
-                    )
-                if not node.returns and node.name != "__init__":
-                    pass
-                    # Relaxed: We let MyPy handle missing return checks, 
-                    # as this stricter check might block valid quick scripts.
-                    # Uncomment to enforce:
-                    # issues.append((node.lineno, f"Function '{node.name}' missing return type hint", ""))
+        # Type comments are never inspected, so the parser need not keep them
+        tree = ast.parse(content, filename=str(filepath), type_comments=False)
     except SyntaxError as e:
         issues.append((0, f"Syntax error: {e}", ""))
+    else:
+        visitor = _QualityVisitor()
+        visitor.visit(tree)
+        issues.extend(visitor.issues)
+        # Only the few lines holding a flagged pass are sliced out
+        line_starts = _line_starts(content) if visitor.pass_lines else []
+        for line_num in visitor.pass_lines:
+            line = _line_text(content, line_starts, line_num).strip()
+            # A pass sharing its line with a comment or code is intended
+            if line == "pass":
+                issues.append((line_num, _EMPTY_PASS_MESSAGE, line))
     return issues
 
 
-def check_file(filepath: Path) -> list[tuple[int, str, str]]:
-    """Check a Python file for quality issues."""
-    try:
-        content = filepath.read_text(encoding="utf-8")
-        lines = content.splitlines()
+def _has_anchor(raw: bytes) -> bool:
+    """Return True if raw could contain a banned pattern or magic number."""
+    return (
+        any(anchor in raw for anchor in _ANCHORS)
+        or _CASELESS_ANCHOR_RE.search(raw) is not None
+    )
 
-        issues = []
-        issues.extend(check_banned_patterns(lines, filepath))
-        issues.extend(check_magic_numbers(lines, filepath))
+
+def check_file(
+    filepath: Path,
+    *,
+    use_cache: bool = True,
+) -> list[tuple[int, str, str]]:
+    """Check a Python file for quality issues.
+
+    Unless use_cache is False, the complete result is cached against the
+    file's modification time and size, so an unchanged file costs one stat and
+    one small JSON read.
+    """
+    # Skip before reading anything rather than in each check
+    if filepath.name in _SELF_NAMES:
+        return []
+    cache_path: Path | None = None
+    try:
+        if use_cache:
+            cache_path = _issues_cache_path(filepath, filepath.stat())
+            cached = _load_issues(cache_path)
+            if cached is not None:
+                return cached
+
+        raw = filepath.read_bytes()
+        content = _decode_source(raw)
+        issues = check_lines(content, filepath) if _has_anchor(raw) else []
         issues.extend(check_ast_issues(content, filepath))
     except (OSError, UnicodeDecodeError) as e:
         return [(0, f"Error reading file: {e}", "")]
     else:
+        if cache_path is not None:
+            _save_issues(cache_path, issues)
         return issues
 
 
+def _color(code: str, text: str) -> str:
+    """Wrap text in an ANSI color code when stderr is a terminal."""
+    return f"{code}{text}{_ENDC}" if _USE_COLOR else text
+
+
+def _iter_python_files(
+    root: Path,
+    exclude_dirs: frozenset[str],
+) -> Iterator[Path]:
+    """Yield the .py files under root without entering excluded directories."""
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in exclude_dirs:
+                        pending.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield Path(entry.path)
+
+
+def _check_files(
+    python_files: list[Path],
+    *,
+    use_cache: bool = True,
+) -> list[list[tuple[int, str, str]]]:
+    """Run check_file over each file, fanning out across CPU cores if worthwhile."""
+    check = functools.partial(check_file, use_cache=use_cache)
+    if len(python_files) < _PARALLEL_MIN_FILES:
+        return [check(filepath) for filepath in python_files]
+    # Compiled patterns live at module level, so each worker builds them once
+    with ProcessPoolExecutor() as executor:
+        return list(
+            executor.map(check, python_files, chunksize=_PARALLEL_CHUNKSIZE),
+        )
+
+
 def main() -> None:
     """Run quality checks on Python files."""
+    args = sys.argv[1:]
+    use_cache = _NO_CACHE_FLAG not in args and not os.environ.get(_NO_CACHE_ENV)
     # Support direct file arguments from pre-commit
-    if len(sys.argv) > 1:
-        python_files = [Path(arg) for arg in sys.argv[1:]]
+    file_args = [arg for arg in args if arg != _NO_CACHE_FLAG]
+    if file_args:
+        python_files = [Path(arg) for arg in file_args]
     else:
-        python_files = list(Path().rglob("*.py"))
-
-    # Exclude certain directories
-    exclude_dirs = {
-        "archive",
-        "legacy",
-        "experimental",
-        ".git",
-        "__pycache__",
-        ".ruff_cache",
-        ".mypy_cache",
-        "matlab",
-        "output",
-        ".ipynb_checkpoints",  # Add checkpoint files to exclusion
-        ".Trash",  # Add trash files to exclusion
-    }
-    
-    # Filter if scanning directory
-    if len(sys.argv) <= 1:
-        python_files = [
-            f for f in python_files if not any(part in exclude_dirs for part in f.parts)
-        ]
-
-    all_issues = []
-    for filepath in python_files:
-        issues = check_file(filepath)
-        if issues:
-            all_issues.append((filepath, issues))
+        # Excluded directories are pruned during the walk rather than
+        # descended into and filtered afterwards
+        python_files = sorted(_iter_python_files(Path(), _EXCLUDE_DIRS))
+
+    if use_cache:
+        _prune_issues_cache()
+    results = _check_files(python_files, use_cache=use_cache)
+    all_issues = [
+        (filepath, issues)
+        for filepath, issues in zip(python_files, results, strict=True)
+        if issues
+    ]
 
     # Report
     if all_issues:
-        sys.stderr.write(
-            f"{Colors.FAIL}{Colors.BOLD}❌ Quality check FAILED{Colors.ENDC}\n\n"
-        )
+        # Assemble the whole report and write it once rather than per line
+        report = [_color(_FAIL + _BOLD, "❌ Quality check FAILED"), "\n\n"]
         for filepath, issues in all_issues:
-            sys.stderr.write(f"\n{Colors.CYAN}{filepath}:{Colors.ENDC}\n")
+            report.append("\n" + _color(_CYAN, f"{filepath}:") + "\n")
             for line_num, message, code in issues:
                 if line_num > 0:
-                    sys.stderr.write(
-                        f"  Line {Colors.BOLD}{line_num}{Colors.ENDC}: {message}\n"
+                    report.append(
+                        "  Line " + _color(_BOLD, str(line_num)) + f": {message}\n"
                     )
                     if code:
-                        sys.stderr.write(f"    > {Colors.WARNING}{code}{Colors.ENDC}\n")
+                        report.append("    > " + _color(_WARNING, code) + "\n")
                 else:
-                    sys.stderr.write(f"  {message}\n")
+                    report.append(f"  {message}\n")
 
         total_issues = sum(len(issues) for _, issues in all_issues)
-        sys.stderr.write(
-            f"\n{Colors.FAIL}Total issues: {total_issues}{Colors.ENDC}\n",
-        )
+        report.append("\n" + _color(_FAIL, f"Total issues: {total_issues}") + "\n")
+        sys.stderr.write("".join(report))
         sys.exit(1)
     else:
         # success silent for pre-commit usually, but ok to print
@@ -10,22 +10,186 @@ This is the unified version combining the best features from all repository impl
 
 Usage:
     python tools/matlab_utilities/scripts/matlab_quality_check.py
-        [--strict] [--output-format json|text] [--project-root PATH]
+        [--strict] [--output-format json|text] [--project-root PATH] [--no-cache]
 """
 
 import argparse
+import bisect
+import contextlib
+import functools
 import json
 import logging
+import os
 import re
+import shutil
 import subprocess
 import sys
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
+from itertools import chain
 from pathlib import Path
-from typing import Final
+from typing import Any, Final
 
 # Constants
 # [s] Timeout for MATLAB script execution - 5 minutes allows for large codebase analysis
 MATLAB_SCRIPT_TIMEOUT_SECONDS: Final[int] = 300
+# [lines] Output kept from each MATLAB stream; earlier lines are dropped as
+# they arrive so a verbose run cannot grow memory without bound
+_OUTPUT_TAIL_LINES: Final[int] = 2000
+# [files] Below this many files, starting worker processes costs more than it saves
+_PARALLEL_MIN_FILES: Final[int] = 32
+# [files] Files handed to a worker per round trip when analyzing in parallel
+_PARALLEL_CHUNKSIZE: Final[int] = 16
+
+
+# A leading \b stops the regex engine skipping ahead to a pattern's first
+# literal, making it try every position of the file; \bword is rewritten as the
+# equivalent word(?<!\wword), which starts with the literal
+_LEADING_BOUNDARY_RE: Final = re.compile(r"^\\b(\w+)")
+
+
+def _line_pattern(*alternatives: str, flags: int = 0) -> re.Pattern[str]:
+    """Compile alternatives to scan a whole file without matching across lines.
+
+    ^ matches at the start of every line, and whitespace classes are narrowed
+    to exclude the newline, so each match lies within the line it starts on.
+    """
+    pattern = "|".join(
+        _LEADING_BOUNDARY_RE.sub(r"\1(?<!\\w\1)", alternative)
+        for alternative in alternatives
+    )
+    return re.compile(pattern.replace(r"\s", r"[^\S\n]"), flags | re.MULTILINE)
+
+
+# Patterns used by the static analysis, compiled once at import. Each runs
+# once over a whole file; the lines it matched are then looked up by number,
+# so lines matching nothing never reach Python-level code
+# The first word of a line that opens or closes a block, as group 1; any word
+# beginning with "function" is captured whole, since all of those count as
+# function lines but only "function" itself opens a block
+_BLOCK_WORD_RE: Final = _line_pattern(
+    r"^\s*(function\w*|if|for|while|switch|try|parfor|classdef|arguments|properties|methods|events|end)\b",
+)
+# Words that open a block closed by a matching end
+_OPENING_KEYWORDS: Final = frozenset(
+    {
+        "function",
+        "if",
+        "for",
+        "while",
+        "switch",
+        "try",
+        "parfor",
+        "classdef",
+        "arguments",
+        "properties",
+        "methods",
+        "events",
+    },
+)
+_EVAL_RE: Final = _line_pattern(r"\beval\s*\(")
+_ASSIGNIN_RE: Final = _line_pattern(r"\bassignin\s*\(")
+_EVALIN_RE: Final = _line_pattern(r"\bevalin\s*\(")
+_GLOBAL_RE: Final = _line_pattern(r"\bglobal\s+\w+")
+# Both command syntax (load file.mat) and function syntax (load('file.mat'))
+_LOAD_RE: Final = _line_pattern(r"^\s*load\s+\w+", r"^\s*load\s*\([^)\n]+\)")
+_CLEAR_ALL_RE: Final = _line_pattern(
+    r"\bclear\s+(all|global)\b",
+    flags=re.IGNORECASE,
+)
+_CLEAR_BARE_RE: Final = _line_pattern(r"\bclear\b(?!\s+\w+)")
+_CLC_RE: Final = _line_pattern(r"\bclc\b")
+_CLOSE_ALL_RE: Final = _line_pattern(r"\bclose\s+all\b")
+_EXIST_RE: Final = _line_pattern(r"\bexist\s*\(")
+_ADDPATH_RE: Final = _line_pattern(r"\baddpath\s*\(")
+_LINE_FEED_RE: Final = re.compile(r"\n")
+
+# Banned patterns (in comments and code), reported once per line each
+_BANNED_PATTERNS: Final = (
+    (re.compile(r"\bTODO\b"), "TODO placeholder found"),
+    (re.compile(r"\bFIXME\b"), "FIXME placeholder found"),
+    (re.compile(r"\bHACK\b"), "HACK comment found"),
+    (re.compile(r"\bXXX\b"), "XXX comment found"),
+    (re.compile(r"<[A-Z_][A-Z0-9_]*>"), "Angle bracket placeholder found"),
+    (re.compile(r"\{\{.*?\}\}"), "Template placeholder found"),
+)
+# Matches wherever any banned pattern does, so the few lines containing one
+# are the only ones searched pattern by pattern
+_BANNED_RE: Final = _line_pattern(
+    *(pattern.pattern for pattern, _ in _BANNED_PATTERNS),
+)
+
+# Matches both integer and floating-point literals (e.g., 3.14, 42, 0.5)
+# that are not part of scientific notation, array indices, or embedded
+# in words. Uses lookbehind/lookahead to avoid matching numbers adjacent
+# to dots or word characters. This helps flag "magic numbers" in code
+# while avoiding false positives from common patterns. The lookbehind sits
+# after the first digit so the engine can skip straight to digits.
+_MAGIC_NUMBER_RE: Final = _line_pattern(r"\d(?<![.\w]\d)\d*(?:\.\d+)?(?![.\w])")
+
+# Known acceptable values (include integer and float representations)
+_ACCEPTABLE_NUMBERS: Final = frozenset(
+    {
+        "0",
+        "0.0",
+        "1",
+        "1.0",
+        "2",
+        "2.0",
+        "3",
+        "3.0",
+        "4",
+        "4.0",
+        "5",
+        "5.0",
+        "10",
+        "10.0",
+        "100",
+        "100.0",
+        "1000",
+        "1000.0",
+        "0.5",
+        "0.1",
+        "0.01",
+        "0.001",
+        "0.0001",  # Common tolerances
+    },
+)
+
+# Known physics constants (should be defined but at least flag with context)
+# Includes units and sources per coding guidelines
+_KNOWN_CONSTANTS: Final = {
+    "3.14159": "pi constant [dimensionless] - mathematical constant",
+    "3.1416": "pi constant [dimensionless] - mathematical constant",
+    "3.14": "pi constant [dimensionless] - mathematical constant",
+    "1.5708": "pi/2 constant [dimensionless] - mathematical constant",
+    "1.57": "pi/2 constant [dimensionless] - mathematical constant",
+    "0.7854": "pi/4 constant [dimensionless] - mathematical constant",
+    "0.785": "pi/4 constant [dimensionless] - mathematical constant",
+    "9.81": "gravitational acceleration [m/s²] - approximate standard gravity",
+    "9.8": "gravitational acceleration [m/s²] - approximate standard gravity",
+    "9.807": "gravitational acceleration [m/s²] - approximate standard gravity",
+}
+
+# [chars] A comment line longer than this right after a function counts as
+# its docstring
+_MIN_DOCSTRING_LENGTH: Final[int] = 3
+# [lines] How far after a function line its arguments block may start
+_ARGUMENTS_SEARCH_LINES: Final[int] = 15
+
+# [bytes] Size of each os.read call; most .m files fit in a single read
+_READ_CHUNK_BYTES: Final[int] = 1 << 20
+
+# Issues from earlier runs, keyed by file path and stored with the file's
+# modification time and size, so an unchanged file is not read again
+_CACHE_PATH: Final = Path(".quality_check_cache") / "matlab_issues.json"
+# The entries each cache file held when this process last loaded or saved it,
+# so checking a tree again in the same process neither reads nor parses the
+# JSON; entries are still matched against each file's current stamp
+_cache_in_memory: dict[Path, dict[str, list[Any]]] = {}
 
 # Set up logging
 logging.basicConfig(
@@ -35,16 +199,501 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _read_source(file_path: str) -> str:
+    """Read a source file as text, the way open(errors="ignore").read() would.
+
+    The raw bytes are read with os.read and decoded in one call, skipping the
+    buffered reader, text wrapper and incremental decoder a text-mode open
+    builds for every file. Newlines are translated as text mode does.
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunks = []
+        while chunk := os.read(fd, _READ_CHUNK_BYTES):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    content = b"".join(chunks).decode("utf-8", errors="ignore")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _line_starts(content: str) -> list[int]:
+    """Return the offset at which each line of content starts."""
+    return [0, *(match.end() for match in _LINE_FEED_RE.finditer(content))]
+
+
+def _matched_lines(
+    pattern: re.Pattern[str],
+    content: str,
+    line_starts: list[int],
+) -> set[int]:
+    """Return the 1-based numbers of lines containing a match of pattern."""
+    return {
+        bisect.bisect_right(line_starts, match.start())
+        for match in pattern.finditer(content)
+    }
+
+
+def _iter_m_files(root: Path) -> Iterator[str]:
+    """Yield the paths of the .m files under root.
+
+    Walks with os.scandir, whose entries carry their file type, instead of
+    Path.rglob, which builds a Path and may stat every entry. Files come out
+    in the same order as rglob: each directory's files, then its
+    subdirectories depth first.
+    """
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        subdirs = []
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith(".m"):
+                    yield entry.path
+        pending.extend(reversed(subdirs))
+
+
+def _analyze_matlab_file(file_path: str) -> list[str]:
+    """Analyze a single MATLAB file for quality issues.
+
+    Args:
+        file_path: Path to the MATLAB file
+
+    Returns:
+        List of quality issues found
+    """
+    issues = []
+    file_name = os.path.basename(file_path)
+
+    try:
+        content = _read_source(file_path)
+        line_starts = _line_starts(content)
+        num_lines = len(line_starts)
+
+        def matched(pattern: re.Pattern[str]) -> set[int]:
+            return _matched_lines(pattern, content, line_starts)
+
+        # Only the few lines that are checked are sliced out of content, rather
+        # than splitting the whole file into one string per line
+        def line_at(line_num: int) -> str:
+            end = line_starts[line_num] - 1 if line_num < num_lines else len(content)
+            return content[line_starts[line_num - 1] : end]
+
+        # Lines opening a block, (sorted) those opening an arguments block,
+        # lines closing a block and function lines, all from one scan
+        opening_lines: set[int] = set()
+        arguments_lines: list[int] = []
+        end_lines: set[int] = set()
+        function_lines: set[int] = set()
+        for match in _BLOCK_WORD_RE.finditer(content):
+            line_num = bisect.bisect_right(line_starts, match.start())
+            keyword = match.group(1)
+            if keyword == "end":
+                end_lines.add(line_num)
+                continue
+            if keyword.startswith("function"):
+                function_lines.add(line_num)
+            if keyword in _OPENING_KEYWORDS:
+                opening_lines.add(line_num)
+                if keyword == "arguments":
+                    arguments_lines.append(line_num)
+        banned_lines = matched(_BANNED_RE)
+        eval_lines = matched(_EVAL_RE)
+        assignin_lines = matched(_ASSIGNIN_RE)
+        evalin_lines = matched(_EVALIN_RE)
+        global_lines = matched(_GLOBAL_RE)
+        # The line-anchored load scan and the case-insensitive clear scan cannot
+        # skip ahead to their keyword, so a plain substring search rules them
+        # out first for the many files that never mention it
+        load_lines = matched(_LOAD_RE) if "load" in content else set()
+        clear_all_lines = (
+            matched(_CLEAR_ALL_RE) if "clear" in content.lower() else set()
+        )
+        clear_bare_lines = matched(_CLEAR_BARE_RE)
+        clc_lines = matched(_CLC_RE)
+        close_all_lines = matched(_CLOSE_ALL_RE)
+        exist_lines = matched(_EXIST_RE)
+        addpath_lines = matched(_ADDPATH_RE)
+
+        # Magic numbers that will be reported, with their column, in order by
+        # line (common values are allowed and never reach the per-line checks)
+        magic_numbers: dict[int, list[tuple[str, int]]] = {}
+        for match in _MAGIC_NUMBER_RE.finditer(content):
+            num = match.group()
+            if num in _KNOWN_CONSTANTS or num not in _ACCEPTABLE_NUMBERS:
+                start = match.start()
+                line_num = bisect.bisect_right(line_starts, start)
+                magic_numbers.setdefault(line_num, []).append(
+                    (num, start - line_starts[line_num - 1]),
+                )
+
+        # Track if we're in a function and nesting level
+        in_function = False
+        nesting_level = 0
+
+        # Only lines matched by some pattern can change the nesting or
+        # have an issue; visit those in order
+        candidate_lines = sorted(
+            opening_lines.union(
+                end_lines,
+                function_lines,
+                banned_lines,
+                eval_lines,
+                assignin_lines,
+                evalin_lines,
+                global_lines,
+                load_lines,
+                magic_numbers,
+                clear_all_lines,
+                clear_bare_lines,
+                clc_lines,
+                close_all_lines,
+                exist_lines,
+                addpath_lines,
+            ),
+        )
+
+        # Check for basic quality issues
+        for i in candidate_lines:
+            line_original = line_at(i)  # Keep original for indentation checks
+            line_stripped = line_original.strip()
+
+            # Skip comment-only lines for most checks (but check comments for banned patterns)
+            is_comment = line_stripped.startswith("%")
+
+            # Track function scope by monitoring nesting level (neither
+            # pattern can match a comment line)
+            # Note: arguments, properties, methods, events also have 'end'
+            if i in opening_lines:
+                if i in function_lines:
+                    in_function = True
+                nesting_level += 1
+
+            # Check for 'end' keyword that decreases nesting
+            if i in end_lines:
+                nesting_level -= 1
+                if nesting_level <= 0:
+                    in_function = False
+                    nesting_level = 0  # Prevent negative nesting
+
+            # Check for function definition (for docstring and arguments validation)
+            if i in function_lines:
+                # Check if next non-empty line has docstring
+                has_docstring = False
+                for j in range(i, min(i + 5, num_lines)):
+                    next_line = line_at(j + 1).strip()
+                    if next_line and not next_line.startswith("%"):
+                        break
+                    if (
+                        next_line.startswith("%")
+                        and len(next_line) > _MIN_DOCSTRING_LENGTH
+                    ):
+                        has_docstring = True
+                        break
+
+                if not has_docstring:
+                    issues.append(
+                        f"{file_name} (line {i}): Missing function docstring",
+                    )
+
+                # Check for arguments validation block within the lines that
+                # follow (comment lines can never open one)
+                k = bisect.bisect_right(arguments_lines, i)
+                has_arguments = (
+                    k < len(arguments_lines)
+                    and arguments_lines[k] <= i + _ARGUMENTS_SEARCH_LINES
+                )
+
+                if not has_arguments:
+                    issues.append(
+                        f"{file_name} (line {i}): Missing arguments validation block",
+                    )
+
+            # Check for banned patterns (in comments and code)
+            if i in banned_lines:
+                for pattern, message in _BANNED_PATTERNS:
+                    if pattern.search(line_stripped):
+                        issues.append(f"{file_name} (line {i}): {message}")
+
+            # Skip further checks for comment lines
+            if is_comment:
+                continue
+
+            # Check for common MATLAB anti-patterns
+            if i in eval_lines:
+                issues.append(
+                    f"{file_name} (line {i}): "
+                    "Avoid using eval() - potential security risk and "
+                    "performance issue",
+                )
+
+            if i in assignin_lines:
+                issues.append(
+                    f"{file_name} (line {i}): "
+                    "Avoid using assignin() - violates encapsulation",
+                )
+
+            if i in evalin_lines:
+                issues.append(
+                    f"{file_name} (line {i}): "
+                    "Avoid using evalin() - violates encapsulation",
+                )
+
+            # Check for global variables (often code smell)
+            if i in global_lines:
+                issues.append(
+                    f"{file_name} (line {i}): "
+                    "Global variable usage - consider passing as argument",
+                )
+
+            # Check for load without output (loads into workspace)
+            # Match both command syntax (load file.mat) and function syntax (load('file.mat'))
+            if i in load_lines and "=" not in line_stripped:
+                issues.append(
+                    f"{file_name} (line {i}): "
+                    "load without output variable - use 'data = load(...)' "
+                    "instead",
+                )
+
+            # Check for magic numbers (but allow common values and known constants)
+            if i in magic_numbers:
+                comment_idx = line_original.find("%")
+                for num, num_idx in magic_numbers[i]:
+                    # Check if it's a known constant
+                    if num in _KNOWN_CONSTANTS:
+                        issues.append(
+                            f"{file_name} (line {i}): Magic number {num} "
+                            f"({_KNOWN_CONSTANTS[num]}) - define as named constant",
+                        )
+                    # Check if the number appears before a comment on same line; a
+                    # number in the comment still counts if the same digits occur
+                    # earlier in the code
+                    elif (
+                        comment_idx == -1
+                        or num_idx < comment_idx
+                        or line_original.find(num, 0, comment_idx) != -1
+                    ):
+                        issues.append(
+                            f"{file_name} (line {i}): Magic number {num} "
+                            "should be defined as constant with units and source",
+                        )
+
+            # Check for clear/clc/close all in functions (bad practice)
+            if in_function:
+                # Check for clear without variable (dangerous) or clear all/global
+                # (very dangerous)
+                if i in clear_all_lines:
+                    issues.append(
+                        f"{file_name} (line {i}): Avoid 'clear all' or "
+                        "'clear global' in functions - clears all variables, "
+                        "functions, and MEX links",
+                    )
+                elif i in clear_bare_lines:
+                    issues.append(
+                        f"{file_name} (line {i}): Avoid 'clear' in "
+                        "functions - can clear function variables",
+                    )
+                if i in clc_lines:
+                    issues.append(
+                        f"{file_name} (line {i}): Avoid 'clc' in functions "
+                        "- affects user's workspace",
+                    )
+                if i in close_all_lines:
+                    issues.append(
+                        f"{file_name} (line {i}): Avoid 'close all' in "
+                        "functions - closes user's figures",
+                    )
+
+            # Check for exist() usage (often code smell, prefer try/catch or validation)
+            if i in exist_lines:
+                issues.append(
+                    f"{file_name} (line {i}): Consider using validation "
+                    "or try/catch instead of exist()",
+                )
+
+            # Check for addpath in functions (should be in startup.m or managed externally)
+            if in_function and i in addpath_lines:
+                issues.append(
+                    f"{file_name} (line {i}): Avoid addpath in functions "
+                    "- manage paths externally",
+                )
+
+    except Exception as e:
+        issues.append(f"{file_name}: Could not analyze file - {e!s}")
+
+    return issues
+
+
+def _analyze_matlab_files(m_files: list[str]) -> list[list[str]]:
+    """Analyze each file, fanning out across CPU cores if worthwhile.
+
+    Args:
+        m_files: Paths of the MATLAB files
+
+    Returns:
+        The issues found in each file, in the order of m_files
+    """
+    if len(m_files) < _PARALLEL_MIN_FILES:
+        return [_analyze_matlab_file(m_file) for m_file in m_files]
+    # Compiled patterns live at module level, so each worker builds them once
+    with ProcessPoolExecutor() as executor:
+        return list(
+            executor.map(_analyze_matlab_file, m_files, chunksize=_PARALLEL_CHUNKSIZE),
+        )
+
+
+def _file_stamp(file_path: str) -> list[int] | None:
+    """Return the (mtime_ns, size) pair used to detect changed files."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _checker_stamp() -> list[int]:
+    """Return a stamp that changes whenever this script or Python changes."""
+    return [*sys.version_info[:2], *(_file_stamp(__file__) or [])]
+
+
+def _load_cache(cache_path: Path) -> dict[str, list[Any]]:
+    """Load cached issues, discarding them if written by another checker."""
+    files_in_memory = _cache_in_memory.get(cache_path)
+    if files_in_memory is not None:
+        return files_in_memory
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("checker") != _checker_stamp():
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_cache(cache_path: Path, files: dict[str, list[Any]]) -> None:
+    """Write cached issues atomically; the cache is best effort."""
+    _cache_in_memory[cache_path] = files
+    with contextlib.suppress(OSError):
+        cache_path.parent.mkdir(exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        payload = {"checker": _checker_stamp(), "files": files}
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        tmp_path.replace(cache_path)
+
+
+def _analyze_matlab_files_cached(
+    m_files: list[str],
+    cache_path: Path,
+) -> list[list[str]]:
+    """Analyze files, reusing cached issues for files unchanged since last run.
+
+    Args:
+        m_files: Paths of the MATLAB files
+        cache_path: JSON file holding the issues from the previous run
+
+    Returns:
+        The issues found in each file, in the order of m_files
+    """
+    cache = _load_cache(cache_path)
+    updated: dict[str, list[Any]] = {}
+    results: dict[str, list[str]] = {}
+    stale: list[tuple[str, list[int] | None]] = []
+    for m_file in m_files:
+        # Stamp before analyzing so an edit made mid-run is reanalyzed next time
+        stamp = _file_stamp(m_file)
+        entry = cache.get(m_file)
+        if stamp is not None and entry is not None and entry[0] == stamp:
+            results[m_file] = entry[1]
+            updated[m_file] = entry
+        else:
+            stale.append((m_file, stamp))
+
+    fresh = _analyze_matlab_files([m_file for m_file, _ in stale])
+    for (m_file, stamp), issues in zip(stale, fresh, strict=True):
+        results[m_file] = issues
+        if stamp is not None:
+            updated[m_file] = [stamp, issues]
+
+    # Only files seen this run are kept, so deleted files drop out of the cache
+    _save_cache(cache_path, updated)
+    return [results[m_file] for m_file in m_files]
+
+
+@functools.cache
+def _find_executable(name: str) -> str | None:
+    """Return the path of an executable on PATH, probing once per process."""
+    return shutil.which(name)
+
+
+def _run_command_tail(cmd: list[str], cwd: Path) -> tuple[int, str, str]:
+    """Run a command, keeping only the last lines of its stdout and stderr.
+
+    Both pipes are drained on helper threads as the command writes to them,
+    so neither can fill and block the command, and at most
+    _OUTPUT_TAIL_LINES lines of each are held at once.
+
+    Args:
+        cmd: Command and arguments to run
+        cwd: Working directory for the command
+
+    Returns:
+        The return code and the tails of stdout and stderr
+
+    Raises:
+        subprocess.TimeoutExpired: If the command ran longer than
+            MATLAB_SCRIPT_TIMEOUT_SECONDS and was killed
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        cwd=cwd,
+    )
+    stdout_tail: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+    stderr_tail: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+    readers = [
+        threading.Thread(target=tail.extend, args=(pipe,), daemon=True)
+        for tail, pipe in ((stdout_tail, process.stdout), (stderr_tail, process.stderr))
+    ]
+    for reader in readers:
+        reader.start()
+    try:
+        returncode = process.wait(timeout=MATLAB_SCRIPT_TIMEOUT_SECONDS)
+    except subprocess.TimeoutExpired:
+        # Like subprocess.run, do not wait for the pipes: a child the command
+        # started may still hold them open
+        process.kill()
+        process.wait()
+        raise
+    for reader in readers:
+        reader.join()
+    for pipe in (process.stdout, process.stderr):
+        if pipe is not None:
+            pipe.close()
+    return returncode, "".join(stdout_tail), "".join(stderr_tail)
+
+
 class MATLABQualityChecker:
     """Comprehensive MATLAB code quality checker."""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, *, use_cache: bool = True):
         """Initialize the MATLAB quality checker.
 
         Args:
             project_root: Path to the project root directory
+            use_cache: Reuse issues from earlier runs for unchanged files
         """
         self.project_root = project_root
+        self.use_cache = use_cache
         self.matlab_dir = project_root / "matlab"
         self.results = {
             "timestamp": datetime.now(UTC).isoformat(),
@@ -54,6 +703,9 @@ class MATLABQualityChecker:
             "summary": "",
             "checks": {},
         }
+        # Paths found by check_matlab_files_exist, reused by the analysis so
+        # the tree is only walked once
+        self._m_files: list[str] | None = None
 
     def check_matlab_files_exist(self) -> bool:
         """Check if MATLAB files exist in the project.
@@ -68,7 +720,7 @@ class MATLABQualityChecker:
             )
             return False
 
-        m_files = list(self.matlab_dir.rglob("*.m"))
+        m_files = self._m_files = list(_iter_m_files(self.matlab_dir))
         self.results["total_files"] = len(m_files)
 
         if len(m_files) == 0:
@@ -130,31 +782,27 @@ class MATLABQualityChecker:
                 ],
                 ["octave", "--no-gui", "--eval", f"run('{script_path}')"],
             ]
+            # Spawning a missing binary only to catch FileNotFoundError costs
+            # a fork and exec per attempt, so skip those not on PATH
+            commands = [cmd for cmd in commands if _find_executable(cmd[0])]
 
             for cmd in commands:
                 try:
                     logger.info("Trying command: %s", " ".join(cmd))
-                    result = subprocess.run(
+                    returncode, stdout, stderr = _run_command_tail(
                         cmd,
-                        capture_output=True,
-                        text=True,
-                        cwd=self.matlab_dir,
-                        timeout=MATLAB_SCRIPT_TIMEOUT_SECONDS,
-                        check=False,
+                        self.matlab_dir,
                     )
 
-                    if result.returncode == 0:
+                    if returncode == 0:
                         logger.info("MATLAB quality checks completed successfully")
                         return {
                             "success": True,
-                            "output": result.stdout,
+                            "output": stdout,
                             "method": "matlab_script",
                         }
-                    logger.warning(
-                        "Command failed with return code %d",
-                        result.returncode,
-                    )
-                    logger.debug("stderr: %s", result.stderr)
+                    logger.warning("Command failed with return code %d", returncode)
+                    logger.debug("stderr: %s", stderr)
 
                 except (subprocess.TimeoutExpired, FileNotFoundError):
                     continue
@@ -175,14 +823,20 @@ class MATLABQualityChecker:
         """
         logger.info("Performing static MATLAB file analysis")
 
-        issues = []
-        total_files = 0
+        m_files = self._m_files
+        if m_files is None:
+            m_files = list(_iter_m_files(self.matlab_dir))
 
         # Analyze each MATLAB file
-        for m_file in self.matlab_dir.rglob("*.m"):
-            total_files += 1
-            file_issues = self._analyze_matlab_file(m_file)
-            issues.extend(file_issues)
+        if self.use_cache:
+            all_issues = _analyze_matlab_files_cached(
+                m_files,
+                self.project_root / _CACHE_PATH,
+            )
+        else:
+            all_issues = _analyze_matlab_files(m_files)
+        total_files = len(m_files)
+        issues = list(chain.from_iterable(all_issues))
 
         self.results["total_files"] = total_files
         self.results["issues"] = issues
@@ -196,271 +850,6 @@ class MATLABQualityChecker:
             "passed": len(issues) == 0,
         }
 
-    def _analyze_matlab_file(self, file_path: Path) -> list[str]:
-        """Analyze a single MATLAB file for quality issues.
-
-        Args:
-            file_path: Path to the MATLAB file
-
-        Returns:
-            List of quality issues found
-        """
-        issues = []
-
-        try:
-            with file_path.open(encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-                lines = content.split("\n")
-
-            # Track if we're in a function and nesting level
-            in_function = False
-            nesting_level = 0
-
-            # Check for basic quality issues
-            for i, line in enumerate(lines, 1):
-                line_stripped = line.strip()
-                line_original = line  # Keep original for indentation checks
-
-                # Skip empty lines
-                if not line_stripped:
-                    continue
-
-                # Skip comment-only lines for most checks (but check comments for banned patterns)
-                is_comment = line_stripped.startswith("%")
-
-                # Track function scope by monitoring nesting level
-                if not is_comment:
-                    # Check for keywords that increase nesting
-                    # Note: arguments, properties, methods, events also have 'end'
-                    if re.match(
-                        r"\b(function|if|for|while|switch|try|parfor|classdef|arguments|properties|methods|events)\b",
-                        line_stripped,
-                    ):
-                        if line_stripped.startswith("function"):
-                            in_function = True
-                        nesting_level += 1
-
-                    # Check for 'end' keyword that decreases nesting
-                    if re.match(r"\bend\b", line_stripped):
-                        nesting_level -= 1
-                        if nesting_level <= 0:
-                            in_function = False
-                            nesting_level = 0  # Prevent negative nesting
-
-                # Check for function definition (for docstring and arguments validation)
-                if line_stripped.startswith("function") and not is_comment:
-                    # Check if next non-empty line has docstring
-                    has_docstring = False
-                    for j in range(i, min(i + 5, len(lines))):
-                        next_line = lines[j].strip()
-                        if next_line and not next_line.startswith("%"):
-                            break
-                        min_comment_length = 3
-                        if (
-                            next_line.startswith("%")
-                            and len(next_line) > min_comment_length
-                        ):
-                            has_docstring = True
-                            break
-
-                    if not has_docstring:
-                        issues.append(
-                            f"{file_path.name} (line {i}): Missing function docstring",
-                        )
-
-                    # Check for arguments validation block
-                    # Skip comment lines to avoid false positives
-                    has_arguments = False
-                    for j in range(i, min(i + 15, len(lines))):
-                        line_check = lines[j].strip()
-                        # Skip comment lines
-                        if line_check.startswith("%"):
-                            continue
-                        if re.match(r"arguments\b", line_check):
-                            has_arguments = True
-                            break
-
-                    if not has_arguments:
-                        issues.append(
-                            f"{file_path.name} (line {i}): Missing arguments validation block",
-                        )
-
-                # Check for banned patterns (in comments and code)
-                banned_patterns = [
-                    (r"\bTODO\b", "TODO placeholder found"),
-                    (r"\bFIXME\b", "FIXME placeholder found"),
-                    (r"\bHACK\b", "HACK comment found"),
-                    (r"\bXXX\b", "XXX comment found"),
-                    (r"<[A-Z_][A-Z0-9_]*>", "Angle bracket placeholder found"),
-                    (r"\{\{.*?\}\}", "Template placeholder found"),
-                ]
-
-                for pattern, message in banned_patterns:
-                    if re.search(pattern, line_stripped):
-                        issues.append(f"{file_path.name} (line {i}): {message}")
-
-                # Skip further checks for comment lines
-                if is_comment:
-                    continue
-
-                # Check for common MATLAB anti-patterns
-                if re.search(r"\beval\s*\(", line_stripped):
-                    issues.append(
-                        f"{file_path.name} (line {i}): "
-                        "Avoid using eval() - potential security risk and "
-                        "performance issue",
-                    )
-
-                if re.search(r"\bassignin\s*\(", line_stripped):
-                    issues.append(
-                        f"{file_path.name} (line {i}): "
-                        "Avoid using assignin() - violates encapsulation",
-                    )
-
-                if re.search(r"\bevalin\s*\(", line_stripped):
-                    issues.append(
-                        f"{file_path.name} (line {i}): "
-                        "Avoid using evalin() - violates encapsulation",
-                    )
-
-                # Check for global variables (often code smell)
-                if re.search(r"\bglobal\s+\w+", line_stripped):
-                    issues.append(
-                        f"{file_path.name} (line {i}): "
-                        "Global variable usage - consider passing as argument",
-                    )
-
-                # Check for load without output (loads into workspace)
-                # Match both command syntax (load file.mat) and function syntax (load('file.mat'))
-                if (
-                    re.search(r"^\s*load\s+\w+", line_stripped)
-                    or re.search(r"^\s*load\s*\([^)]+\)", line_stripped)
-                ) and "=" not in line_stripped:
-                    issues.append(
-                        f"{file_path.name} (line {i}): "
-                        "load without output variable - use 'data = load(...)' "
-                        "instead",
-                    )
-
-                # Check for magic numbers (but allow common values and known constants)
-                # Matches both integer and floating-point literals (e.g., 3.14, 42, 0.5)
-                # that are not part of scientific notation, array indices, or embedded
-                # in words. Uses lookbehind/lookahead to avoid matching numbers adjacent
-                # to dots or word characters. This helps flag "magic numbers" in code
-                # while avoiding false positives from common patterns.
-                magic_number_pattern = r"(?<![.\w])(?:\d+\.\d+|\d+)(?![.\w])"
-                magic_numbers = re.findall(magic_number_pattern, line_stripped)
-
-                # Known acceptable values (include integer and float representations)
-                acceptable_numbers = {
-                    "0",
-                    "0.0",
-                    "1",
-                    "1.0",
-                    "2",
-                    "2.0",
-                    "3",
-                    "3.0",
-                    "4",
-                    "4.0",
-                    "5",
-                    "5.0",
-                    "10",
-                    "10.0",
-                    "100",
-                    "100.0",
-                    "1000",
-                    "1000.0",
-                    "0.5",
-                    "0.1",
-                    "0.01",
-                    "0.001",
-                    "0.0001",  # Common tolerances
-                }
-
-                # Known physics constants (should be defined but at least flag with context)
-                # Includes units and sources per coding guidelines
-                known_constants = {
-                    "3.14159": "pi constant [dimensionless] - mathematical constant",
-                    "3.1416": "pi constant [dimensionless] - mathematical constant",
-                    "3.14": "pi constant [dimensionless] - mathematical constant",
-                    "1.5708": "pi/2 constant [dimensionless] - mathematical constant",
-                    "1.57": "pi/2 constant [dimensionless] - mathematical constant",
-                    "0.7854": "pi/4 constant [dimensionless] - mathematical constant",
-                    "0.785": "pi/4 constant [dimensionless] - mathematical constant",
-                    "9.81": "gravitational acceleration [m/s²] - approximate standard gravity",
-                    "9.8": "gravitational acceleration [m/s²] - approximate standard gravity",
-                    "9.807": "gravitational acceleration [m/s²] - approximate standard gravity",
-                }
-
-                for num in magic_numbers:
-                    # Check if it's a known constant
-                    if num in known_constants:
-                        issues.append(
-                            f"{file_path.name} (line {i}): Magic number {num} "
-                            f"({known_constants[num]}) - define as named constant",
-                        )
-                    elif num not in acceptable_numbers:
-                        # Check if the number appears before a comment on same line
-                        comment_idx = line_original.find("%")
-                        num_idx = line_original.find(num)
-                        if comment_idx == -1 or (
-                            num_idx != -1 and num_idx < comment_idx
-                        ):
-                            issues.append(
-                                f"{file_path.name} (line {i}): Magic number {num} "
-                                "should be defined as constant with units and source",
-                            )
-
-                # Check for clear/clc/close all in functions (bad practice)
-                if in_function:
-                    # Check for clear without variable (dangerous) or clear all/global
-                    # (very dangerous)
-                    if re.search(
-                        r"\bclear\s+(all|global)\b",
-                        line_stripped,
-                        re.IGNORECASE,
-                    ):
-                        issues.append(
-                            f"{file_path.name} (line {i}): Avoid 'clear all' or "
-                            "'clear global' in functions - clears all variables, "
-                            "functions, and MEX links",
-                        )
-                    elif re.search(r"\bclear\b(?!\s+\w+)", line_stripped):
-                        issues.append(
-                            f"{file_path.name} (line {i}): Avoid 'clear' in "
-                            "functions - can clear function variables",
-                        )
-                    if re.search(r"\bclc\b", line_stripped):
-                        issues.append(
-                            f"{file_path.name} (line {i}): Avoid 'clc' in functions "
-                            "- affects user's workspace",
-                        )
-                    if re.search(r"\bclose\s+all\b", line_stripped):
-                        issues.append(
-                            f"{file_path.name} (line {i}): Avoid 'close all' in "
-                            "functions - closes user's figures",
-                        )
-
-                # Check for exist() usage (often code smell, prefer try/catch or validation)
-                if re.search(r"\bexist\s*\(", line_stripped):
-                    issues.append(
-                        f"{file_path.name} (line {i}): Consider using validation "
-                        "or try/catch instead of exist()",
-                    )
-
-                # Check for addpath in functions (should be in startup.m or managed externally)
-                if in_function and re.search(r"\baddpath\s*\(", line_stripped):
-                    issues.append(
-                        f"{file_path.name} (line {i}): Avoid addpath in functions "
-                        "- manage paths externally",
-                    )
-
-        except Exception as e:
-            issues.append(f"{file_path.name}: Could not analyze file - {e!s}")
-
-        return issues
-
     def run_all_checks(self) -> dict[str, object]:
         """Run all MATLAB quality checks.
 
@@ -519,6 +908,11 @@ def main() -> None:
         default=".",
         help="Project root directory (default: current directory)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Analyze every file, ignoring issues cached by earlier runs",
+    )
 
     args = parser.parse_args()
 
@@ -529,7 +923,7 @@ def main() -> None:
         sys.exit(1)
 
     # Initialize and run quality checks
-    checker = MATLABQualityChecker(project_root)
+    checker = MATLABQualityChecker(project_root, use_cache=not args.no_cache)
     results = checker.run_all_checks()
 
     # Output results
@@ -1,41 +1,60 @@
 import ast
 import json
+import os
+import re
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-RISKS = []
+# Method names of the trig functions whose numeric arguments are checked
+_TRIG_FUNCTIONS = frozenset({"sin", "cos", "tan"})
+# Constant value types that count as a bare number
+_NUMERIC_TYPES = (int, float)
+# Bytes that any flagged node needs in its source: a division operator or a
+# trig method access. Files without one are not parsed at all.
+_CANDIDATE_RE = re.compile(rb"/|\.\s*(?:sin|cos|tan)\b")
 
+# Below this many files, starting worker processes costs more than it saves
+_PARALLEL_MIN_FILES = 32
+# Files handed to a worker per round trip when auditing in parallel
+_PARALLEL_CHUNKSIZE = 32
 
-class ScienceAuditor(ast.NodeVisitor):
-    def visit_BinOp(self, node: ast.BinOp) -> None:  # noqa: N802
-        # 1. Division Safety
-        # Use simple nested if to avoid complex boolean expression lint struggles or
-        # suppress SIM102 if preferred. Actually, combining them is cleaner.
-        if isinstance(node.op, ast.Div) and not (
-            isinstance(node.right, ast.Constant) and node.right.value != 0
-        ):
-            RISKS.append(
-                {
-                    "line": node.lineno,
-                    "type": "Singularity Risk",
-                    "msg": "Division by variable detected. Check denominator.",
-                },
-            )
-        self.generic_visit(node)
 
-    def visit_Call(self, node: ast.Call) -> None:  # noqa: N802
+def audit(tree: ast.AST) -> list[dict[str, object]]:
+    """Return the scientific risks in a parsed module, in source order.
+
+    Nodes are taken depth first from an explicit stack, in the order
+    ast.NodeVisitor would visit them, without its per-node method lookup.
+    """
+    risks: list[dict[str, object]] = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        # 1. Division Safety
+        if isinstance(node, ast.BinOp):
+            if isinstance(node.op, ast.Div) and not (
+                isinstance(node.right, ast.Constant) and node.right.value != 0
+            ):
+                risks.append(
+                    {
+                        "line": node.lineno,
+                        "type": "Singularity Risk",
+                        "msg": "Division by variable detected. Check denominator.",
+                    },
+                )
         # 2. Trig Safety
-        if isinstance(node.func, ast.Attribute) and node.func.attr in [
-            "sin",
-            "cos",
-            "tan",
-        ]:
+        elif (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr in _TRIG_FUNCTIONS
+        ):
             # Flag if the argument is a numeric constant (likely ambiguous units)
             if any(
-                isinstance(arg, ast.Constant) and isinstance(arg.value, int | float)
+                isinstance(arg, ast.Constant) and isinstance(arg.value, _NUMERIC_TYPES)
                 for arg in node.args
             ):
-                RISKS.append(
+                risks.append(
                     {
                         "line": node.lineno,
                         "type": "Unit Ambiguity",
@@ -46,28 +65,73 @@ class ScienceAuditor(ast.NodeVisitor):
                         ),
                     },
                 )
-        self.generic_visit(node)
+        stack.extend(reversed(list(ast.iter_child_nodes(node))))
+    return risks
+
+
+def _iter_python_files(root: Path) -> Iterator[Path]:
+    """Yield the .py files under root that are not tests, in rglob's order.
+
+    os.scandir reports each entry's type with the listing, so unlike rglob
+    nothing is listed twice. Each directory's files come before its
+    subdirectories, which are walked depth first.
+    """
+    pending = [os.fspath(root)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        subdirs = []
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith(".py") and "test" not in entry.name:
+                    yield Path(entry.path)
+        pending.extend(reversed(subdirs))
+
+
+def _audit_file(py_file: Path) -> tuple[list[dict[str, object]], str | None]:
+    """Audit one file, returning its risks and the error that stopped it, if any.
+
+    Errors are returned rather than written so parallel runs report them in
+    file order. Files that cannot contain a risk are decoded but not parsed.
+    """
+    try:
+        data = py_file.read_bytes()
+        source = data.decode("utf-8")
+        if _CANDIDATE_RE.search(data) is None:
+            return [], None
+        return audit(ast.parse(source)), None
+    except Exception as e:  # noqa: BLE001
+        # Log error but continue scanning
+        # We catch generic Exception because ast.parse can raise
+        # various errors and we don't want to crash the entire audit.
+        return [], f"Error analyzing {py_file}: {e}\n"
 
 
 def main() -> None:
     target_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else Path()
+    risks: list[dict[str, object]] = []
 
-    # Use rglob to recursively find .py files
-    for py_file in target_dir.rglob("*.py"):
-        if "test" in py_file.name:
-            continue
+    py_files = list(_iter_python_files(target_dir))
+    if len(py_files) < _PARALLEL_MIN_FILES:
+        results = [_audit_file(py_file) for py_file in py_files]
+    else:
+        # Parsing and walking are CPU bound, so fan out across processes
+        with ProcessPoolExecutor() as executor:
+            results = list(
+                executor.map(_audit_file, py_files, chunksize=_PARALLEL_CHUNKSIZE),
+            )
 
-        try:
-            with py_file.open(encoding="utf-8") as source:
-                ScienceAuditor().visit(ast.parse(source.read()))
-        except Exception as e:  # noqa: BLE001
-            # Log error but continue scanning
-            # We catch generic Exception because ast.parse can raise
-            # various errors and we don't want to crash the entire audit.
-            sys.stderr.write(f"Error analyzing {py_file}: {e}\n")
-
-    if RISKS:
-        print(json.dumps(RISKS, indent=2))  # noqa: T201
+    for file_risks, error in results:
+        if error is not None:
+            sys.stderr.write(error)
+        risks.extend(file_risks)
+
+    if risks:
+        print(json.dumps(risks, indent=2))  # noqa: T201
         sys.exit(1)
     else:
         print("[]")  # noqa: T201